@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-15 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nyxboard", "0010_alter_healthcheck_check_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="result",
+            index=models.Index(
+                fields=["health_check", "-created_at"], name="idx_result_hc_created"
+            ),
+        ),
+    ]
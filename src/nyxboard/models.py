@@ -1,9 +1,13 @@
+from collections import Counter
 from time import time
 
 from django.db import models
 
 from nyxmon.domain import ResultStatus, StatusChoices, CheckStatus, CheckType
 
+# How many of a check's newest results its status is derived from
+RECENT_RESULTS_PER_CHECK = 5
+
 
 class Service(models.Model):
     name: models.CharField = models.CharField("Service Name", max_length=255)
@@ -18,30 +22,28 @@ class Service(models.Model):
         """
         Calculate the overall status of the service based on its health checks.
         """
-        health_checks = self.healthcheck_set.all()
-
-        if not health_checks.exists():
-            return StatusChoices.UNKNOWN
+        # One pass over the (possibly prefetched) checks; no checks at all
+        # counts as unknown
+        counts = Counter(check.get_status() for check in self.healthcheck_set.all())
+        total = counts.total()
 
-        statuses = [check.get_status() for check in health_checks]
-
-        if StatusChoices.FAILED in statuses:
+        if counts[StatusChoices.FAILED]:
             return StatusChoices.FAILED
 
-        if StatusChoices.WARNING in statuses or StatusChoices.RECOVERING in statuses:
+        if counts[StatusChoices.WARNING] or counts[StatusChoices.RECOVERING]:
             return StatusChoices.WARNING
 
-        if all(status == StatusChoices.PASSED for status in statuses):
-            return StatusChoices.PASSED
-
-        if all(status == StatusChoices.UNKNOWN for status in statuses):
+        if counts[StatusChoices.UNKNOWN] == total:
             return StatusChoices.UNKNOWN
 
+        if counts[StatusChoices.PASSED] == total:
+            return StatusChoices.PASSED
+
         return StatusChoices.WARNING
 
 
 class HealthCheck(models.Model):
-    CHECK_TYPE_CHOICES = [
+    CHECK_TYPE_CHOICES = (
         (CheckType.HTTP, "HTTP"),
         (CheckType.JSON_HTTP, "JSON-HTTP"),
         (CheckType.TCP, "TCP"),
@@ -50,9 +52,9 @@ class HealthCheck(models.Model):
         (CheckType.SMTP, "SMTP"),
         (CheckType.IMAP, "IMAP"),
         (CheckType.JSON_METRICS, "JSON Metrics"),
-    ]
+    )
 
-    INTERVAL_CHOICES = [
+    INTERVAL_CHOICES = (
         (30, "30 seconds"),
         (60, "1 minute"),
         (300, "5 minutes"),
@@ -60,12 +62,12 @@ class HealthCheck(models.Model):
         (1800, "30 minutes"),
         (3600, "1 hour"),
         (86400, "1 day"),
-    ]
+    )
 
-    STATUS_CHOICES = [
+    STATUS_CHOICES = (
         (CheckStatus.IDLE, "Idle"),
         (CheckStatus.PROCESSING, "Processing"),
-    ]
+    )
 
     name: models.CharField = models.CharField(
         "Check Name",
@@ -119,25 +121,32 @@ class HealthCheck(models.Model):
     def __str__(self):
         return f"{self.name} ({self.get_check_type_display()} Check {self.id})"
 
+    def fetch_recent_results(self, limit=RECENT_RESULTS_PER_CHECK):
+        """
+        Return the newest results, querying at most once per instance and limit.
+        """
+        cache = getattr(self, "_recent_results_cache", None)
+        if cache is None or cache[0] != limit:
+            cache = (limit, list(self.results.order_by("-created_at")[:limit]))
+            self._recent_results_cache = cache
+        return cache[1]
+
     def get_status(self):
         """
         Calculate the health check status based on recent results.
         """
         # Use recent_results if it's available (set by the dashboard view)
-        # Otherwise, query the database
-        if hasattr(self, "recent_results"):
-            recent_results = self.recent_results
+        # Otherwise, query the most recent results; either way evaluate once
+        results = getattr(self, "recent_results", None)
+        if results is None:
+            results = self.fetch_recent_results()
         else:
-            # Get the 5 most recent results
-            recent_results = self.results.order_by("-created_at")[:5]
+            results = list(results)
 
-        if not recent_results:
+        if not results:
             return StatusChoices.UNKNOWN
 
-        latest_result = recent_results[0] if recent_results else None
-
-        if not latest_result:
-            return StatusChoices.UNKNOWN
+        latest_result = results[0]
 
         # Check for Failed status (the latest result is error - critical failures)
         if latest_result.status == ResultStatus.ERROR:
@@ -147,16 +156,17 @@ class HealthCheck(models.Model):
         if latest_result.status == ResultStatus.WARNING:
             return StatusChoices.WARNING
 
-        # Check for Passed status (all recent results are OK)
-        if all(result.status == ResultStatus.OK for result in recent_results):
-            return StatusChoices.PASSED
+        if latest_result.status == ResultStatus.OK:
+            # The latest result is already known, so only scan the older ones
+            older_statuses = {result.status for result in results[1:]}
+
+            # Check for Passed status (all recent results are OK)
+            if older_statuses <= {ResultStatus.OK}:
+                return StatusChoices.PASSED
 
-        # Check for Recovering status (latest is OK but there were recent errors/warnings)
-        if latest_result.status == ResultStatus.OK and any(
-            result.status in (ResultStatus.ERROR, ResultStatus.WARNING)
-            for result in recent_results
-        ):
-            return StatusChoices.RECOVERING
+            # Check for Recovering status (latest is OK but there were recent errors/warnings)
+            if older_statuses & {ResultStatus.ERROR, ResultStatus.WARNING}:
+                return StatusChoices.RECOVERING
 
         # Otherwise, it's a Warning status
         return StatusChoices.WARNING
@@ -181,11 +191,11 @@ class Result(models.Model):
     status: models.CharField = models.CharField(
         "Status",
         max_length=10,
-        choices=[
+        choices=(
             (ResultStatus.OK, "OK"),
             (ResultStatus.WARNING, "Warning"),
             (ResultStatus.ERROR, "Error"),
-        ],
+        ),
     )
     created_at: models.DateTimeField = models.DateTimeField(
         "Created At", auto_now_add=True
@@ -194,6 +204,12 @@ class Result(models.Model):
 
     class Meta:
         db_table = "check_result"
+        indexes = [
+            # Serves "latest N results of a check" without sorting all of them
+            models.Index(
+                fields=["health_check", "-created_at"], name="idx_result_hc_created"
+            ),
+        ]
 
     def __str__(self):
         return f"Result {self.id} for {self.health_check} ({self.status})"
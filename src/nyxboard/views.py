@@ -1,10 +1,19 @@
+from django.db.models import F, Prefetch, Window
+from django.db.models.functions import RowNumber
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 import json
+from collections import defaultdict
 from time import time
 
-from .models import Service, HealthCheck, StatusChoices
+from .models import (
+    RECENT_RESULTS_PER_CHECK,
+    HealthCheck,
+    Result,
+    Service,
+    StatusChoices,
+)
 from .forms import (
     ServiceForm,
     HttpHealthCheckForm,
@@ -29,28 +38,66 @@ FORM_CLASSES = {
 }
 
 
+# HealthCheck columns the list templates read; skips the JSON config blob
+CHECK_LIST_FIELDS = ("id", "service", "name", "check_type", "url")
+# The dashboard cards additionally show scheduling state
+CHECK_CARD_FIELDS = (
+    *CHECK_LIST_FIELDS,
+    "check_interval",
+    "status",
+    "next_check_time",
+    "disabled",
+)
+
+
+def _recent_results_by_check(health_checks) -> dict[int, list[Result]]:
+    """Fetch the newest results of every check in one windowed query."""
+    if not health_checks:
+        return {}
+    newest_first = [F("created_at").desc(), F("id").desc()]
+    recent_results = (
+        Result.objects.filter(health_check__in=health_checks)
+        .annotate(
+            row_number=Window(
+                RowNumber(), partition_by=F("health_check_id"), order_by=newest_first
+            )
+        )
+        .filter(row_number__lte=RECENT_RESULTS_PER_CHECK)
+        .order_by("health_check_id", *newest_first)
+    )
+    results_by_check: dict[int, list[Result]] = defaultdict(list)
+    for result in recent_results:
+        results_by_check[result.health_check_id].append(result)
+    return results_by_check
+
+
 def dashboard(request):
     """
     Function-based view to display the dashboard of services and their health checks.
     """
-    # Get all services with their health checks
-    services = Service.objects.prefetch_related("healthcheck_set")
-
-    # Fetch recent results for all health checks separately
-    health_checks = HealthCheck.objects.filter(service__in=services)
+    # Get all services with their health checks; the template renders these
+    # prefetched check instances, so annotate them rather than refetching
+    services = list(
+        Service.objects.prefetch_related(
+            Prefetch(
+                "healthcheck_set",
+                queryset=HealthCheck.objects.only(*CHECK_CARD_FIELDS),
+            )
+        )
+    )
+    health_checks = [
+        check for service in services for check in service.healthcheck_set.all()
+    ]
+    recent_results_by_check = _recent_results_by_check(health_checks)
 
     # Dictionary to map check IDs to their last result
     check_results = {}
 
-    # For each health check, fetch its recent results separately and determine mode
-    current_time = time()
+    # For each health check, attach its recent results and determine mode
+    current_time = int(time())
 
     for check in health_checks:
-        # Get recent results
-        recent_results = check.results.order_by("-created_at")[:5]
-        check.recent_results = list(
-            recent_results
-        )  # Force evaluation and convert to list
+        check.recent_results = recent_results_by_check.get(check.id, [])
 
         # Set check mode - determines if progress ring is shown or if it's due for a check
         if check.next_check_time <= current_time:
@@ -99,7 +146,10 @@ def service_list(request):
     """
     Display a list of all services.
     """
-    services = Service.objects.all()
+    # Service status only needs each check's id to look up its results
+    services = Service.objects.prefetch_related(
+        Prefetch("healthcheck_set", queryset=HealthCheck.objects.only("id", "service"))
+    )
     return render(request, "nyxboard/service_list.html", {"services": services})
 
 
@@ -108,7 +158,7 @@ def service_detail(request, service_id):
     Display details of a specific service.
     """
     service = get_object_or_404(Service, id=service_id)
-    health_checks = service.healthcheck_set.all()
+    health_checks = service.healthcheck_set.only(*CHECK_LIST_FIELDS)
     return render(
         request,
         "nyxboard/service_detail.html",
@@ -172,7 +222,9 @@ def healthcheck_list(request):
     """
     Display a list of all health checks.
     """
-    health_checks = HealthCheck.objects.all()
+    health_checks = HealthCheck.objects.select_related("service").only(
+        *CHECK_LIST_FIELDS, "service__name"
+    )
     return render(
         request, "nyxboard/healthcheck_list.html", {"health_checks": health_checks}
     )
@@ -334,13 +386,13 @@ def healthcheck_update_status(request, check_id):
     This view is called periodically to check if a health check's status has changed.
     """
     health_check = get_object_or_404(HealthCheck, id=check_id)
-    recent_results = health_check.results.order_by("-created_at")[:5]
+    recent_results = health_check.fetch_recent_results()
 
     # Attach needed data to the health check for the template
     health_check.recent_results = recent_results
 
     # Determine if it's still due or back to normal
-    current_time = time()
+    current_time = int(time())
 
     # Set last_result regardless of status
     last_result = recent_results[0] if recent_results else None
@@ -381,7 +433,7 @@ def healthcheck_trigger(request, check_id):
     health_check = get_object_or_404(HealthCheck, id=check_id)
 
     # Get data needed for the template first
-    recent_results = health_check.results.order_by("-created_at")[:5]
+    recent_results = health_check.fetch_recent_results()
     last_result = recent_results[0] if recent_results else None
     health_check.recent_results = recent_results
 
@@ -415,7 +467,7 @@ def healthcheck_toggle_disabled(request, check_id):
     health_check = get_object_or_404(HealthCheck, id=check_id)
 
     # Get data needed for the template first
-    recent_results = health_check.results.order_by("-created_at")[:5]
+    recent_results = health_check.fetch_recent_results()
     last_result = recent_results[0] if recent_results else None
     health_check.recent_results = recent_results
 
@@ -430,7 +482,7 @@ def healthcheck_toggle_disabled(request, check_id):
     health_check.save()
 
     # Determine check mode based on current status
-    current_time = time()
+    current_time = int(time())
     if health_check.disabled:
         check_mode = "normal"  # Don't show due status for disabled checks
     elif health_check.next_check_time <= current_time:
@@ -14,6 +14,9 @@ from ..adapters.repositories import RepositoryStore
 
 logger = logging.getLogger(__name__)
 
+# Pause between delete batches so other writers can take the database lock
+BATCH_PAUSE = 0.1
+
 
 class ResultsCleaner(Protocol):
     """A protocol for a results cleaner."""
@@ -24,6 +27,7 @@ class ResultsCleaner(Protocol):
         interval: int = 3600,
         retention_period: int = 86400,
         batch_size: int = 1000,
+        vacuum_interval: int = 0,
     ) -> None: ...
 
     def start(self) -> None:
@@ -62,10 +66,17 @@ class AsyncResultsCleaner(ResultsCleaner):
         interval: int = 3600,
         retention_period: int = 86400,
         batch_size: int = 1000,
+        vacuum_interval: int = 0,
     ) -> None:
+        if batch_size <= 0:
+            # LIMIT 0 deletes nothing and a negative LIMIT means no limit, so
+            # the batch loop would never see a short batch
+            raise ValueError("batch_size must be positive")
         self.interval = interval
         self.retention_period = retention_period
         self.batch_size = batch_size
+        self.vacuum_interval = vacuum_interval
+        self._deleted_since_vacuum = 0
         self._running = False
         self._thread = Auto
         self._store = Auto
@@ -90,18 +101,43 @@ class AsyncResultsCleaner(ResultsCleaner):
 
         while self._running:
             try:
-                # Delete old results
-                deleted_count = await self._store.results.delete_old_results_async(
-                    retention_seconds=self.retention_period, batch_size=self.batch_size
-                )
+                deleted_count = await self._delete_old_results()
                 if deleted_count > 0:
                     logger.info(f"Cleaned up {deleted_count} old check results")
+                await self._maybe_vacuum(deleted_count)
             except Exception as e:
                 logger.exception(f"Error during result cleanup: {e}")
 
             # Sleep until next cleanup cycle
             await anyio.sleep(self.interval)
 
+    async def _delete_old_results(self) -> int:
+        """Delete expired results batch by batch until none are left."""
+        deleted_total = 0
+        while True:
+            deleted_count = await self._store.results.delete_old_results_async(
+                retention_seconds=self.retention_period, batch_size=self.batch_size
+            )
+            deleted_total += deleted_count
+            if (
+                deleted_count == 0
+                or deleted_count < self.batch_size
+                or not self._running
+            ):
+                return deleted_total
+            await anyio.sleep(BATCH_PAUSE)
+
+    async def _maybe_vacuum(self, deleted_count: int) -> None:
+        """Run VACUUM once ``vacuum_interval`` results have been deleted."""
+        if not self.vacuum_interval:
+            return
+        self._deleted_since_vacuum += deleted_count
+        if self._deleted_since_vacuum < self.vacuum_interval:
+            return
+        await self._store.results.vacuum_async()
+        self._deleted_since_vacuum = 0
+        logger.info("Vacuumed the results database")
+
     def start(self) -> None:
         thread = threading.Thread(
             target=self._start_in_thread,
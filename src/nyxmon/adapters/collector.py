@@ -75,7 +75,7 @@ class AsyncCheckCollector(CheckCollector):
         i = 0
         while self._running:
             checks = await self._bus.uow.store.checks.list_due_checks_async()
-            print("due checks: ", checks)
+            logger.debug("due checks: %s", checks)
             if len(checks) > 0:
                 # Use a worker thread to run the checks
                 await to_thread.run_sync(self._bus.handle, ExecuteChecks(checks=checks))
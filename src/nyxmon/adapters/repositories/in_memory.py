@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from typing import List
+from typing import Collection, List, Sequence
 
 from ...domain import Result, Check, Service
 from .interface import (
@@ -32,6 +32,10 @@ class InMemoryResultRepository(ResultRepository):
 
         self._timestamps[result.result_id] = int(time.time())
 
+    def add_many(self, results: Sequence[Result]) -> None:
+        for result in results:
+            self.add(result)
+
     def get(self, result_id: int) -> Result:
         return self.results[result_id]
 
@@ -82,6 +86,9 @@ class InMemoryResultRepository(ResultRepository):
 
         return deleted_count
 
+    async def vacuum_async(self) -> None:
+        """Nothing to reclaim in memory."""
+
     def delete_old_results(
         self, retention_seconds: int = 86400, batch_size: int = 1000
     ) -> int:
@@ -107,6 +114,10 @@ class InMemoryCheckRepository(CheckRepository):
         self.checks[check.check_id] = check
         self.seen.add(check)
 
+    def add_many(self, checks: Sequence[Check]) -> None:
+        for check in checks:
+            self.add(check)
+
     def get(self, check_id: int) -> Check:
         return self.checks[check_id]
 
@@ -117,6 +128,17 @@ class InMemoryCheckRepository(CheckRepository):
         """Return checks in an awaitable form for async callers."""
         return self.list()
 
+    async def find_type_not_in_async(
+        self, check_types: Collection[str]
+    ) -> tuple[int, List[tuple[int, str, str]]]:
+        """Count all checks and list (id, name, type) of those not in check_types."""
+        mismatches = [
+            (check.check_id, check.name, check.check_type)
+            for check in self.checks.values()
+            if check.check_type not in check_types
+        ]
+        return len(self.checks), mismatches
+
 
 class InMemoryServiceRepository(ServiceRepository):
     """An in-memory implementation of the ServiceRepository interface."""
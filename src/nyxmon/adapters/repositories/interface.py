@@ -1,4 +1,4 @@
-from typing import List, Protocol, TypeAlias
+from typing import Collection, List, Protocol, Sequence, TypeAlias
 
 from ...domain import Result, Check, Service
 
@@ -12,6 +12,10 @@ class ResultRepository(Protocol):
         """Add a result to the repository."""
         ...
 
+    def add_many(self, results: Sequence[Result]) -> None:
+        """Add several results in one write, skipping rows the store rejects."""
+        ...
+
     def get(self, result_id: int) -> Result:
         """Get a result from the repository by ID."""
         ...
@@ -34,6 +38,10 @@ class CheckRepository(Protocol):
         """Add a check to the repository."""
         ...
 
+    def add_many(self, checks: Sequence[Check]) -> None:
+        """Add or update several checks in one write, skipping rejected rows."""
+        ...
+
     def get(self, check_id: int):
         """Get a check from the repository by ID."""
         ...
@@ -46,6 +54,12 @@ class CheckRepository(Protocol):
         """Get a list of all checks asynchronously."""
         ...
 
+    async def find_type_not_in_async(
+        self, check_types: Collection[str]
+    ) -> tuple[int, List[tuple[int, str, str]]]:
+        """Count all checks and list (id, name, type) of those not in check_types."""
+        ...
+
 
 class ServiceRepository(Protocol):
     """A repository interface for storing and retrieving services."""
@@ -3,7 +3,7 @@ import json
 import logging
 import time
 import datetime
-from typing import Any, List, cast
+from typing import Any, Callable, Collection, List, Sequence, TypeVar, cast
 import anyio
 import aiosqlite
 
@@ -21,6 +21,45 @@ from .interface import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+async def _write_batch(
+    db: aiosqlite.Connection,
+    sql: str,
+    items: Sequence[T],
+    to_row: Callable[[T], tuple],
+) -> list[T]:
+    """Write ``items`` with one executemany and return the ones stored.
+
+    If SQLite rejects any row the batch is retried row by row, so a single bad
+    row is logged and skipped instead of dropping the rest of the batch.
+    """
+    rows: list[tuple[T, tuple]] = []
+    for item in items:
+        try:
+            rows.append((item, to_row(item)))
+        except (TypeError, ValueError):
+            logger.exception("Skipping %r: data is not JSON serializable", item)
+
+    try:
+        await db.executemany(sql, [row for _, row in rows])
+        await db.commit()
+        return [item for item, _ in rows]
+    except sqlite3.Error:
+        await db.rollback()
+
+    written = []
+    for item, row in rows:
+        try:
+            await db.execute(sql, row)
+        except sqlite3.Error:
+            logger.exception("Skipping %r: rejected by SQLite", item)
+        else:
+            written.append(item)
+    await db.commit()
+    return written
+
 
 def row_to_check(row: aiosqlite.Row) -> Check:
     check_id = row["id"]
@@ -91,6 +130,12 @@ class SqliteCheckRepository(CheckRepository):
         with self._portal_provider as portal:
             portal.call(self._add_async, check)
 
+    def add_many(self, checks: Sequence[Check]) -> None:
+        if self._portal_provider is None or not checks:
+            return  # No portal provider set (or nothing to write)
+        with self._portal_provider as portal:
+            portal.call(self._add_many_async, checks)
+
     # ---------- interne async-Implementierung ----------
     async def _get_async(self, check_id: int) -> Check:
         """Get a check from the repository by ID asynchronously."""
@@ -105,15 +150,58 @@ class SqliteCheckRepository(CheckRepository):
                 raise KeyError(f"Check with ID {check_id} not found")
             return row_to_check(row)
 
+    # The whole table as one JSON array whose keys match Check's arguments, so
+    # listing decodes a single value instead of reading every column of every row
+    _LIST_AS_JSON_SQL = """SELECT json_group_array(json_object(
+                   'check_id', id, 'service_id', service_id, 'name', name,
+                   'check_type', check_type, 'url', url,
+                   'check_interval', check_interval,
+                   'next_check_time', next_check_time,
+                   'processing_started_at', processing_started_at,
+                   'status', status, 'disabled', disabled,
+                   'data', json(coalesce(nullif(data, ''), '{}'))))
+                   FROM health_check"""
+
     async def list_async(self) -> List[Check]:
         async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
             await self._ensure_schema(db)
 
-            db.row_factory = aiosqlite.Row
-            rows = await db.execute_fetchall(
-                "SELECT id, service_id, name, check_type, url, check_interval, next_check_time, processing_started_at, status, disabled, data FROM health_check"
+            [(checks_json,)] = await db.execute_fetchall(self._LIST_AS_JSON_SQL)
+            checks = []
+            for fields in json.loads(checks_json):
+                fields["disabled"] = bool(fields["disabled"])
+                checks.append(Check(**fields))
+            return checks
+
+    async def find_type_not_in_async(
+        self, check_types: Collection[str]
+    ) -> tuple[int, List[tuple[int, str, str]]]:
+        """Count all checks and list (id, name, type) of those not in check_types.
+
+        One query does both: the total is joined onto every mismatching row,
+        and onto a single row of NULLs when nothing mismatches. The data
+        column is never read, so large tables are not decoded.
+        """
+        placeholders = ",".join("?" * len(check_types))
+        async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
+            await self._ensure_schema(db)
+
+            rows = list(
+                await db.execute_fetchall(
+                    "SELECT total.n, hc.id, hc.name, hc.check_type "
+                    "FROM (SELECT COUNT(*) AS n FROM health_check) AS total "
+                    "LEFT JOIN health_check AS hc "
+                    f"ON hc.check_type NOT IN ({placeholders}) ORDER BY hc.id",
+                    tuple(check_types),
+                )
             )
-            return [row_to_check(r) for r in rows]
+            total = rows[0][0]
+            mismatches = [
+                (check_id, name, check_type)
+                for _, check_id, name, check_type in rows
+                if check_id is not None
+            ]
+            return total, mismatches
 
     async def list_due_checks_async(self) -> List[Check]:
         async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
@@ -144,31 +232,40 @@ class SqliteCheckRepository(CheckRepository):
 
             return [row_to_check(r) for r in rows]
 
+    _UPSERT_SQL = """INSERT OR REPLACE INTO health_check
+                   (id, service_id, name, check_type, url, check_interval,
+                    status, next_check_time, processing_started_at, disabled, data)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    @staticmethod
+    def _check_row(check: Check) -> tuple:
+        return (
+            check.check_id,
+            check.service_id,
+            check.name,
+            check.check_type,
+            check.url,
+            check.check_interval,
+            check.status,
+            check.next_check_time,
+            check.processing_started_at,
+            int(check.disabled),  # Convert bool to int for SQLite
+            json.dumps(check.data),  # Serialize to JSON
+        )
+
     async def _add_async(self, check: Check) -> None:
         async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
             await self._ensure_schema(db)
 
-            await db.execute(
-                """INSERT OR REPLACE INTO health_check
-                   (id, service_id, name, check_type, url, check_interval,
-                    status, next_check_time, processing_started_at, disabled, data)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    check.check_id,
-                    check.service_id,
-                    check.name,
-                    check.check_type,
-                    check.url,
-                    check.check_interval,
-                    check.status,
-                    check.next_check_time,
-                    check.processing_started_at,
-                    int(check.disabled),  # Convert bool to int for SQLite
-                    json.dumps(check.data),  # Serialize to JSON
-                ),
-            )
+            await db.execute(self._UPSERT_SQL, self._check_row(check))
             await db.commit()
 
+    async def _add_many_async(self, checks: Sequence[Check]) -> None:
+        async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
+            await self._ensure_schema(db)
+
+            await _write_batch(db, self._UPSERT_SQL, checks, self._check_row)
+
     # ---------- Bridge sync → async ----------
     def _await(self, coro):
         async def _run():
@@ -231,6 +328,12 @@ class SqliteResultRepository(ResultRepository):
         with self._portal_provider as portal:
             portal.call(self._add_async, result)
 
+    def add_many(self, results: Sequence[Result]) -> None:
+        if self._portal_provider is None or not results:
+            return  # No portal provider set (or nothing to write)
+        with self._portal_provider as portal:
+            portal.call(self._add_many_async, results)
+
     def get(self, result_id: int) -> Result:
         return self._await(self._get_async(result_id))
 
@@ -241,22 +344,33 @@ class SqliteResultRepository(ResultRepository):
         return self._await(self._list_for_check_async(check_id, limit))
 
     # ---------- interne async-Implementierung ----------
+    _INSERT_SQL = """INSERT INTO check_result (id, health_check_id, status, data, created_at)
+                   VALUES (?, ?, ?, ?, datetime('now'))"""
+
+    @staticmethod
+    def _result_row(result: Result) -> tuple:
+        return (
+            result.result_id,
+            result.check_id,
+            result.status,
+            json.dumps(result.data),
+        )
+
     async def _add_async(self, result: Result) -> None:
         async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
             await self._ensure_schema(db)
-            await db.execute(
-                """INSERT INTO check_result (id, health_check_id, status, data, created_at)
-                   VALUES (?, ?, ?, ?, datetime('now'))""",
-                (
-                    result.result_id,
-                    result.check_id,
-                    result.status,
-                    json.dumps(result.data),
-                ),
-            )
+            await db.execute(self._INSERT_SQL, self._result_row(result))
             await db.commit()
             self.seen.add(result)
 
+    async def _add_many_async(self, results: Sequence[Result]) -> None:
+        async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
+            await self._ensure_schema(db)
+            written = await _write_batch(
+                db, self._INSERT_SQL, results, self._result_row
+            )
+            self.seen.update(written)
+
     async def _get_async(self, result_id: int) -> Result:
         async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
             await self._ensure_schema(db)
@@ -328,36 +442,24 @@ class SqliteResultRepository(ResultRepository):
             )
             cutoff_time_str = cutoff_time.strftime("%Y-%m-%d %H:%M:%S")
 
-            # First, get the IDs to delete (with limit)
-            # SQLite doesn't support LIMIT in DELETE directly, so we need to do this in two steps
+            # A bounded subquery keeps each write transaction short, so the
+            # collector's inserts are not stalled behind one huge delete
             cursor = await db.execute(
-                "SELECT id FROM check_result WHERE created_at < ? ORDER BY id LIMIT ?",
+                "DELETE FROM check_result WHERE id IN "
+                "(SELECT id FROM check_result WHERE created_at < ? ORDER BY id LIMIT ?)",
                 (cutoff_time_str, batch_size),
             )
-            rows = await cursor.fetchall()
-
-            if not rows:
-                return 0
-
-            # Get the IDs to delete as a tuple
-            ids_to_delete = tuple(row[0] for row in rows)
-
-            # If only one ID to delete, we need special SQL syntax (can't use 'IN' with a single value tuple)
-            if len(ids_to_delete) == 1:
-                delete_sql = "DELETE FROM check_result WHERE id = ?"
-                params = (ids_to_delete[0],)
-            else:
-                placeholders = ",".join(["?"] * len(ids_to_delete))
-                delete_sql = f"DELETE FROM check_result WHERE id IN ({placeholders})"
-                params = ids_to_delete
-
-            # Delete the records
-            cursor = await db.execute(delete_sql, params)
             deleted_count = cursor.rowcount
             await db.commit()
 
             return deleted_count
 
+    async def vacuum_async(self) -> None:
+        """Rebuild the database file to reclaim pages freed by deletes."""
+        async with aiosqlite.connect(self._db_path, uri=self._use_uri) as db:
+            # VACUUM cannot run inside a transaction; nothing is open here
+            await db.execute("VACUUM")
+
     def delete_old_results(
         self, retention_seconds: int = 86400, batch_size: int = 1000
     ) -> int:
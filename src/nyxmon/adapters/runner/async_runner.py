@@ -1,5 +1,4 @@
 import anyio
-from anyio import to_thread
 
 from anyio.from_thread import BlockingPortalProvider
 from typing import Iterable, Callable, Set, Optional
@@ -8,10 +7,10 @@ import httpx
 
 from .interface import CheckRunner
 from .executors import ExecutorRegistry, UnknownCheckTypeError
-from .executors.http_executor import HttpCheckExecutor
-from .executors.dns_executor import DnsCheckExecutor
+from .executors.http_executor import HttpCheckExecutor, create_http_client
+from .executors.dns_executor import DnsCheckExecutor, DnspythonResolver
 from .executors.json_metrics_executor import JsonMetricsExecutor
-from .executors.imap_executor import ImapCheckExecutor
+from .executors.imap_executor import ImapCheckExecutor, ImapSessionPool
 from .executors.smtp_executor import SmtpCheckExecutor
 from .executors.tcp_executor import TcpCheckExecutor
 from ...domain import Check, Result, CheckType, ResultStatus
@@ -21,6 +20,9 @@ class AsyncCheckRunner(CheckRunner):
     def __init__(self, portal_provider: BlockingPortalProvider) -> None:
         self.portal_provider = portal_provider
         self.executor_registry = ExecutorRegistry()
+        # Outlives the per-batch executors so configured resolvers are reused
+        self._dns_resolver = DnspythonResolver()
+        self._imap_pool = ImapSessionPool()
         # Pre-register executors for startup validation
         self._preregister_executors()
 
@@ -50,7 +52,7 @@ class AsyncCheckRunner(CheckRunner):
         self.executor_registry.register(CheckType.JSON_HTTP, http_executor)
 
         # Register DNS executor
-        dns_executor = DnsCheckExecutor()
+        dns_executor = DnsCheckExecutor(self._dns_resolver)
         self.executor_registry.register(CheckType.DNS, dns_executor)
 
         # Register TCP executor
@@ -62,7 +64,7 @@ class AsyncCheckRunner(CheckRunner):
         self.executor_registry.register(CheckType.JSON_METRICS, json_executor)
 
         # Register IMAP executor
-        imap_executor = ImapCheckExecutor()
+        imap_executor = ImapCheckExecutor(pool=self._imap_pool)
         self.executor_registry.register(CheckType.IMAP, imap_executor)
 
         # Register SMTP executor
@@ -73,13 +75,21 @@ class AsyncCheckRunner(CheckRunner):
         not_impl = self._NotImplementedExecutor()
         self.executor_registry.register(CheckType.PING, not_impl)
 
+    async def aclose(self) -> None:
+        """Release resources shared across batches, like pooled IMAP sessions."""
+        await self._imap_pool.aclose()
+
     def run_all(self, checks: Iterable[Check], result_received: Callable) -> None:
-        """Run all checks."""
+        """Run all checks.
+
+        ``result_received`` is called on the event loop thread for every result,
+        so it must not block; the service layer only records the result there
+        and stores the whole batch once ``run_all`` returns.
+        """
 
         async def run_checks(result_received_callback: Callable) -> None:
             async for result in self._async_run_all(checks):
-                # Process the result in a worker thread
-                await to_thread.run_sync(result_received_callback, result)
+                result_received_callback(result)
 
         # Run the async function in the portal
         with self.portal_provider as portal:
@@ -107,7 +117,7 @@ class AsyncCheckRunner(CheckRunner):
             # Only create HTTP client if needed
             http_client: Optional[httpx.AsyncClient] = None
             if needs_http_client:
-                http_client = httpx.AsyncClient(follow_redirects=True, timeout=10)
+                http_client = create_http_client(timeout=10)
 
             try:
                 # Register executors with batch context
@@ -155,7 +165,7 @@ class AsyncCheckRunner(CheckRunner):
         )  # JSON_HTTP uses same executor
 
         # Register DNS executor
-        dns_executor = DnsCheckExecutor()
+        dns_executor = DnsCheckExecutor(self._dns_resolver)
         self.executor_registry.register(CheckType.DNS, dns_executor)
 
         # Register TCP executor
@@ -167,7 +177,7 @@ class AsyncCheckRunner(CheckRunner):
         self.executor_registry.register(CheckType.JSON_METRICS, json_executor)
 
         # Register IMAP executor
-        imap_executor = ImapCheckExecutor()
+        imap_executor = ImapCheckExecutor(pool=self._imap_pool)
         self.executor_registry.register(CheckType.IMAP, imap_executor)
 
         # Register SMTP executor
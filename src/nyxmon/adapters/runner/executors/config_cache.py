@@ -0,0 +1,63 @@
+"""Shared cache of parsed check configurations."""
+
+from collections import OrderedDict
+from typing import Any, Protocol, Self, TypeVar
+
+# Distinct check configs are few; the bound only guards against churn
+MAX_CACHED_CONFIGS = 4096
+
+
+class _CheckConfig(Protocol):
+    @classmethod
+    def from_dict(cls, data: dict) -> Self: ...
+
+    def validate(self) -> bool: ...
+
+
+ConfigT = TypeVar("ConfigT", bound=_CheckConfig)
+
+# Least recently used first, so a burst of one-off configs only evicts
+# other cold entries
+_cache: OrderedDict[tuple[type, Any], Any] = OrderedDict()
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable copy of a JSON-like value.
+
+    Every value is tagged with its type so data that merely compares equal
+    (``True`` and ``1``, a dict and a list of pairs) never shares an entry.
+    """
+    if isinstance(value, dict):
+        return dict, tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return list, tuple(_freeze(item) for item in value)
+    return type(value), value
+
+
+def _parse(config_cls: type[ConfigT], data: dict[str, Any]) -> ConfigT:
+    config = config_cls.from_dict(data)
+    config.validate()
+    return config
+
+
+def load_config(config_cls: type[ConfigT], data: dict[str, Any]) -> ConfigT:
+    """Return the validated ``config_cls`` for ``data``, reusing earlier parses.
+
+    Checks poll with the same data every cycle, so parsed configs are keyed on
+    the content of ``data`` rather than its identity: the repository builds a
+    fresh dict per batch, and edits made in place still get a new entry.
+    Invalid data raises every time; unhashable values skip the cache.
+    """
+    try:
+        key = (config_cls, _freeze(data))
+        config = _cache.get(key)
+    except TypeError:
+        return _parse(config_cls, data)
+    if config is None:
+        config = _parse(config_cls, data)
+        _cache[key] = config
+        if len(_cache) > MAX_CACHED_CONFIGS:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return config
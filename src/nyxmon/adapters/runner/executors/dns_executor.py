@@ -2,7 +2,7 @@
 
 import time
 from dataclasses import dataclass
-from typing import Any, List, Protocol
+from typing import Any, FrozenSet, List, Protocol
 
 import dns.asyncresolver
 import dns.rdatatype
@@ -11,6 +11,7 @@ import dns.resolver
 
 from ....domain import Check, Result, ResultStatus
 from ....domain.dns_config import DnsCheckConfig
+from .config_cache import load_config
 
 
 @dataclass
@@ -28,24 +29,77 @@ class DnsResolver(Protocol):
         """Resolve ``domain`` according to ``config`` and return structured data."""
 
 
+def _copy_dns_error(error: Exception) -> Exception:
+    """Rebuild a cached failure so concurrent checks never share one instance.
+
+    dnspython exceptions built from keyword arguments keep them in ``kwargs``
+    (``args`` then only holds the rendered message), so prefer those.
+    """
+    kwargs = getattr(error, "kwargs", None)
+    if kwargs:
+        return type(error)(**kwargs)
+    return type(error)(*error.args)
+
+
 class DnspythonResolver:
-    """Resolver implementation backed by dnspython."""
+    """Resolver implementation backed by dnspython.
 
-    async def query(self, domain: str, config: DnsCheckConfig) -> DnsResolverResult:
-        resolver = dns.asyncresolver.Resolver()
+    NXDOMAIN and timeout failures are remembered for ``negative_ttl`` seconds,
+    so a broken target fails fast instead of paying the full timeout again.
+    """
 
-        if config.dns_server:
-            resolver.nameservers = [config.dns_server]
+    def __init__(self, negative_ttl: float = 10.0) -> None:
+        self.negative_ttl = negative_ttl
+        self._resolvers: dict[tuple[str | None, float], dns.asyncresolver.Resolver] = {}
+        self._negative: dict[
+            tuple[str, str, str | None, str | None, float], tuple[float, Exception]
+        ] = {}
 
-        resolver.timeout = config.timeout
-        resolver.lifetime = config.timeout
+    def _get_resolver(self, config: DnsCheckConfig) -> dns.asyncresolver.Resolver:
+        """Return a configured resolver, building it only on first use.
 
-        if config.source_ip:
-            answer = await resolver.resolve(
-                domain, config.query_type, source=config.source_ip
-            )
-        else:
-            answer = await resolver.resolve(domain, config.query_type)
+        Building a resolver re-reads ``/etc/resolv.conf``, so keep one per
+        nameserver/timeout pair. Construction never awaits, so no lock is needed.
+        """
+        key = (config.dns_server, config.timeout)
+        resolver = self._resolvers.get(key)
+        if resolver is None:
+            resolver = dns.asyncresolver.Resolver()
+            if config.dns_server:
+                resolver.nameservers = [config.dns_server]
+            resolver.timeout = config.timeout
+            resolver.lifetime = config.timeout
+            self._resolvers[key] = resolver
+        return resolver
+
+    async def query(self, domain: str, config: DnsCheckConfig) -> DnsResolverResult:
+        key = (
+            domain,
+            config.query_type,
+            config.dns_server,
+            config.source_ip,
+            config.timeout,
+        )
+        cached = self._negative.get(key)
+        if cached is not None:
+            expires_at, error = cached
+            if time.monotonic() < expires_at:
+                raise _copy_dns_error(error)
+            del self._negative[key]
+
+        resolver = self._get_resolver(config)
+
+        try:
+            if config.source_ip:
+                answer = await resolver.resolve(
+                    domain, config.query_type, source=config.source_ip
+                )
+            else:
+                answer = await resolver.resolve(domain, config.query_type)
+        except (dns.resolver.NXDOMAIN, dns.resolver.Timeout) as err:
+            if self.negative_ttl > 0:
+                self._negative[key] = (time.monotonic() + self.negative_ttl, err)
+            raise
 
         resolved_data: list[str] = []
         for rdata in answer:
@@ -91,19 +145,18 @@ class DnsCheckExecutor:
 
     async def execute(self, check: Check) -> Result:
         """Execute a DNS check and return a Result."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            config = DnsCheckConfig.from_dict(check.data)
-            config.validate()
+            config = load_config(DnsCheckConfig, check.data)
 
             resolver_result = await self._resolver.query(check.url, config)
             resolved_ips = resolver_result.records
             dns_metadata = resolver_result.metadata
 
-            query_time_ms = int((time.time() - start_time) * 1000)
+            query_time_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
-            if self._check_ip_match(resolved_ips, config.expected_ips):
+            if self._check_ip_match(resolved_ips, config.expected_ips_set):
                 return self._create_success_result(
                     check.check_id,
                     resolved_ips,
@@ -150,19 +203,17 @@ class DnsCheckExecutor:
                 str(err),
             )
 
-    def _check_ip_match(self, resolved: List[str], expected: List[str]) -> bool:
+    def _check_ip_match(self, resolved: List[str], expected: FrozenSet[str]) -> bool:
         """Check if any resolved IP matches any expected IP.
 
         Args:
             resolved: List of resolved IPs
-            expected: List of expected IPs
+            expected: Set of expected IPs, prebuilt on the config
 
         Returns:
             True if there's at least one match
         """
-        resolved_set = set(resolved)
-        expected_set = set(expected)
-        return bool(resolved_set & expected_set)
+        return any(ip in expected for ip in resolved)
 
     def _create_success_result(
         self,
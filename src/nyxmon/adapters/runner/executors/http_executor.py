@@ -1,14 +1,38 @@
 """HTTP check executor implementation."""
 
-import asyncio
+import importlib.util
 import time
 from typing import Any, Optional
 
-import anyio
 import httpx
 
 from ....domain import Check, Result, ResultStatus
 from ....domain.http_config import HttpCheckConfig
+from .config_cache import load_config
+from .retry import sleep_before_retry
+
+# HTTP/2 lets concurrent checks against one host share a connection, but
+# httpx only supports it when the optional h2 package is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+
+
+def create_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create an AsyncClient with the pool limits and protocol checks use.
+
+    Extra keyword arguments are passed through to ``httpx.AsyncClient``.
+    """
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        http2=_HTTP2_AVAILABLE,
+        limits=_CLIENT_LIMITS,
+        **kwargs,
+    )
 
 
 class HttpCheckExecutor:
@@ -26,26 +50,20 @@ class HttpCheckExecutor:
         """
         self._client = client
         self._owns_client = client is None
-        self._created_client: Optional[httpx.AsyncClient] = None
-        self._client_lock = asyncio.Lock()
 
-    async def _get_client(self) -> httpx.AsyncClient:
+    def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client.
 
-        Thread-safe creation of HTTP client for concurrent check execution.
+        Creation is synchronous and never awaits, so concurrent checks on the
+        event loop cannot race here and no lock is needed. The client is still
+        built lazily so batches without HTTP checks never open one.
 
         Returns:
             HTTP client instance
         """
-        if self._client is not None:
-            return self._client
-
-        # Protect client creation from concurrent access
-        async with self._client_lock:
-            if self._created_client is None:
-                self._created_client = httpx.AsyncClient(follow_redirects=True)
-
-        return self._created_client
+        if self._client is None:
+            self._client = create_http_client()
+        return self._client
 
     async def execute(self, check: Check) -> Result:
         """Execute an HTTP check and return a Result.
@@ -57,8 +75,7 @@ class HttpCheckExecutor:
             Result with HTTP response information
         """
         try:
-            config = HttpCheckConfig.from_dict(check.data)
-            config.validate()
+            config = load_config(HttpCheckConfig, check.data)
         except ValueError as exc:
             return self._error(
                 check.check_id,
@@ -67,11 +84,11 @@ class HttpCheckExecutor:
                 {"attempt": 0, "attempts": 0},
             )
 
-        client = await self._get_client()
+        client = self._get_client()
         attempts = config.retries + 1
 
         for attempt in range(1, attempts + 1):
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
                 response = await client.get(
                     check.url,
@@ -84,7 +101,7 @@ class HttpCheckExecutor:
                     and status_code != config.expected_status
                 ):
                     if status_code in config.retry_status_codes and attempt < attempts:
-                        await anyio.sleep(config.retry_delay)
+                        await sleep_before_retry(config.retry_delay, attempt - 1)
                         continue
                     return self._error(
                         check.check_id,
@@ -132,7 +149,7 @@ class HttpCheckExecutor:
                         },
                     )
 
-                duration_ms = int((time.time() - start) * 1000)
+                duration_ms = (time.perf_counter_ns() - start) // 1_000_000
                 data: dict[str, Any] = {}
                 if attempt > 1 or attempts > 1:
                     data.update(
@@ -171,7 +188,7 @@ class HttpCheckExecutor:
                     "attempts": attempts,
                 }
                 if attempt < attempts:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt - 1)
                     continue
                 return Result(
                     check_id=check.check_id,
@@ -186,7 +203,7 @@ class HttpCheckExecutor:
                     "attempts": attempts,
                 }
                 if attempt < attempts:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt - 1)
                     continue
                 return Result(
                     check_id=check.check_id,
@@ -201,7 +218,7 @@ class HttpCheckExecutor:
                     "attempts": attempts,
                 }
                 if attempt < attempts:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt - 1)
                     continue
                 return Result(
                     check_id=check.check_id,
@@ -245,7 +262,7 @@ class HttpCheckExecutor:
             "attempts": attempts,
         }
         if status_code in config.retry_status_codes and attempt < attempts:
-            await anyio.sleep(config.retry_delay)
+            await sleep_before_retry(config.retry_delay, attempt - 1)
             return None
         return Result(
             check_id=check_id,
@@ -266,6 +283,6 @@ class HttpCheckExecutor:
         Only closes the client if this executor created it.
         Externally provided clients are not closed.
         """
-        if self._owns_client and self._created_client is not None:
-            await self._created_client.aclose()
-            self._created_client = None
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import time
 import imaplib
+import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
@@ -13,9 +15,28 @@ import anyio
 
 from ....domain import Check, Result, ResultStatus, ResultStatusType
 from ....domain.imap_config import ImapCheckConfig
+from .config_cache import load_config
+from .retry import sleep_before_retry
 from urllib.parse import urlparse
 
 
+# UID FETCH responses carry one line per message:
+# b'12 (UID 345 INTERNALDATE "...")' where 12 is the sequence number
+_FETCH_UID_RE = re.compile(rb"\bUID (\d+)")
+
+_MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+
+
+def _imap_since_date(cutoff: datetime) -> str:
+    """Format a SEARCH SINCE date (DD-Mon-YYYY) for prefiltering on the server.
+
+    SINCE only has day resolution and is evaluated in the server's timezone,
+    so go back one extra day; the exact minute cutoff is applied client-side.
+    """
+    day = cutoff - timedelta(days=1)
+    return f"{day.day:02d}-{_MONTHS[day.month - 1]}-{day.year}"
+
+
 @dataclass
 class ImapMessage:
     """Representation of a matched IMAP message."""
@@ -49,8 +70,101 @@ class ImapSession(Protocol):
         self, subject: str, max_age_minutes: int
     ) -> list[ImapMessage]: ...
 
+    async def search_latest(
+        self, subject: str, max_age_minutes: int
+    ) -> list[ImapMessage]: ...
+
     async def delete_messages(self, ids: list[str]) -> None: ...
 
+    async def ping(self) -> bool: ...
+
+
+SessionKey = tuple[str, int, str, str | None, str | None, str, float]
+
+
+class ImapSessionPool:
+    """Keep authenticated IMAP sessions alive between checks.
+
+    Connecting, negotiating TLS, logging in and selecting the folder cost
+    several round trips, so healthy sessions are parked here after a check and
+    handed out again for the next check against the same account. The runner
+    owns the pool and closes it on shutdown.
+    """
+
+    def __init__(self, max_per_key: int = 4, idle_timeout: float = 300.0) -> None:
+        self.max_per_key = max_per_key
+        self.idle_timeout = idle_timeout
+        self._idle: dict[SessionKey, list[tuple[float, ImapSession]]] = {}
+        self._closed = False
+        # aclose() runs on the agent's main loop while a check that outlived
+        # the collector may still release a session on the portal loop
+        self._lock = threading.Lock()
+
+    async def acquire(self, key: SessionKey) -> ImapSession | None:
+        """Return a live pooled session for ``key`` or None on a miss."""
+        await self._reap_expired()
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if self._closed or not idle:
+                    return None
+                _, session = idle.pop()
+            if await session.ping():
+                return session
+            await self._discard(session)
+
+    async def release(self, key: SessionKey, session: ImapSession) -> None:
+        """Park a healthy session for reuse.
+
+        The session is logged out instead if the pool is full or closed.
+        """
+        await self._reap_expired()
+        with self._lock:
+            if not self._closed:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_per_key:
+                    idle.append((time.monotonic(), session))
+                    return
+        await self._discard(session)
+
+    async def aclose(self) -> None:
+        """Log out every pooled session; later releases log out immediately."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for sessions in idle.values():
+            for _, session in sessions:
+                await self._discard(session)
+
+    async def _reap_expired(self) -> None:
+        """Log out sessions idle for longer than ``idle_timeout``, for any key.
+
+        Sessions for checks that were removed or reconfigured would otherwise
+        stay connected until shutdown.
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        expired: list[ImapSession] = []
+        with self._lock:
+            for key in list(self._idle):
+                idle = self._idle[key]
+                if all(last_used >= cutoff for last_used, _ in idle):
+                    continue
+                expired.extend(s for last_used, s in idle if last_used < cutoff)
+                idle[:] = [entry for entry in idle if entry[0] >= cutoff]
+                if not idle:
+                    del self._idle[key]
+        for session in expired:
+            await self._discard(session)
+
+    async def _discard(self, session: ImapSession) -> None:
+        # Shielded so a cancelled check still logs out instead of leaking
+        with anyio.CancelScope(shield=True):
+            try:
+                await session.__aexit__(None, None, None)
+            except Exception:
+                # Best-effort logout; the connection is dropped either way
+                pass
+
 
 class ImapLibSession:
     """Concrete IMAP session backed by imaplib, run in worker threads."""
@@ -68,12 +182,15 @@ class ImapLibSession:
         await self._logout()
 
     async def _connect(self) -> None:
-        def _make_connection():
-            if self.config.tls_mode == "implicit":
-                return imaplib.IMAP4_SSL(
-                    self.host, self.config.port, timeout=self.config.timeout
-                )
+        self._conn = await anyio.to_thread.run_sync(self._open)
 
+    def _open(self) -> imaplib.IMAP4:
+        """Connect, log in and select the folder in one worker thread."""
+        if self.config.tls_mode == "implicit":
+            conn: imaplib.IMAP4 = imaplib.IMAP4_SSL(
+                self.host, self.config.port, timeout=self.config.timeout
+            )
+        else:
             conn = imaplib.IMAP4(
                 self.host, self.config.port, timeout=self.config.timeout
             )
@@ -81,12 +198,11 @@ class ImapLibSession:
                 typ, _ = conn.starttls()
                 if typ != "OK":
                     raise ImapTransientError("STARTTLS failed")
-            return conn
 
-        self._conn = await anyio.to_thread.run_sync(_make_connection)
-
-        await self._run_checked("login", self.config.username, self.config.password)
-        await self._run_checked("select", self.config.folder)
+        self._conn = conn
+        self._call("login", self.config.username, self.config.password)
+        self._call("select", self.config.folder)
+        return conn
 
     async def _logout(self) -> None:
         if not self._conn:
@@ -100,17 +216,15 @@ class ImapLibSession:
         finally:
             self._conn = None
 
-    async def _run_checked(self, method: str, *args):
+    def _call(self, method: str, *args):
+        """Issue one IMAP command on the current (worker) thread."""
         if self._conn is None:
             raise ImapCheckError("IMAP connection not initialized")
 
-        def _call():
-            fn = getattr(self._conn, method)
-            return fn(*args)
-
-        typ, data = await anyio.to_thread.run_sync(_call)
+        typ, data = getattr(self._conn, method)(*args)
         if typ != "OK":
-            raise ImapCheckError(f"{method} failed: {typ} {data}")
+            command = f"uid {args[0]}" if method == "uid" else method
+            raise ImapCheckError(f"{command} failed: {typ} {data}")
         return data
 
     async def search_recent(
@@ -119,46 +233,89 @@ class ImapLibSession:
         if self._conn is None:
             raise ImapCheckError("IMAP connection not initialized")
 
-        search_data = await self._run_checked(
-            "search", None, "NOT", "DELETED", "HEADER", "SUBJECT", f'"{subject}"'
+        # SEARCH and FETCH share one thread hop instead of one per command
+        return await anyio.to_thread.run_sync(
+            self._search_recent, subject, max_age_minutes
+        )
+
+    async def search_latest(
+        self, subject: str, max_age_minutes: int
+    ) -> list[ImapMessage]:
+        """Like search_recent, but only FETCH the newest matching message."""
+        if self._conn is None:
+            raise ImapCheckError("IMAP connection not initialized")
+
+        return await anyio.to_thread.run_sync(
+            self._search_recent, subject, max_age_minutes, True
+        )
+
+    def _search_recent(
+        self, subject: str, max_age_minutes: int, latest_only: bool = False
+    ) -> list[ImapMessage]:
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
+        search_data = self._call(
+            "uid",
+            "SEARCH",
+            "NOT",
+            "DELETED",
+            "SINCE",
+            _imap_since_date(cutoff),
+            "HEADER",
+            "SUBJECT",
+            f'"{subject}"',
+        )
+        # Keep UIDs as bytes: they only feed the FETCH set until a match is kept
+        ids: list[bytes] = (
+            search_data[0].split() if search_data and search_data[0] else []
         )
-        ids = search_data[0].decode().split() if search_data and search_data[0] else []
         if not ids:
             return []
+        if latest_only:
+            # UIDs ascend in arrival order, so the last one is the newest
+            ids = ids[-1:]
 
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
+        internaldates = self._fetch_internaldates(ids)
         messages: list[ImapMessage] = []
 
         for msg_id in ids:
-            internaldate = await self._fetch_internaldate(msg_id)
+            internaldate = internaldates.get(msg_id)
             if internaldate is None or internaldate < cutoff:
                 continue
 
             messages.append(
-                ImapMessage(uid=msg_id, subject=subject, internaldate=internaldate)
+                ImapMessage(
+                    uid=msg_id.decode(), subject=subject, internaldate=internaldate
+                )
             )
 
         return messages
 
-    async def _fetch_internaldate(self, msg_id: str) -> datetime | None:
-        data = await self._run_checked("fetch", msg_id, "(INTERNALDATE)")
-        # imaplib returns list where first element contains INTERNALDATE string
-        if not data or not data[0]:
-            return None
+    def _fetch_internaldates(self, ids: list[bytes]) -> dict[bytes, datetime]:
+        """Fetch INTERNALDATE for all UIDs with a single UID FETCH round trip."""
+        data = self._call("uid", "FETCH", b",".join(ids), "(UID INTERNALDATE)")
+        internaldates: dict[bytes, datetime] = {}
+        for raw in data or []:
+            if isinstance(raw, tuple):
+                raw = raw[0]
+            # Skip b")" separators and anything that isn't a message line
+            match = _FETCH_UID_RE.search(raw) if isinstance(raw, bytes) else None
+            if match is None:
+                continue
+
+            internaldate = self._parse_internaldate(raw)
+            if internaldate is not None:
+                internaldates[match.group(1)] = internaldate
 
-        raw = data[0]
-        if isinstance(raw, tuple):
-            raw = raw[0]
+        return internaldates
 
+    def _parse_internaldate(self, raw: bytes) -> datetime | None:
         parsed_tuple: time.struct_time | None = None
         parsed_dt: datetime | None = None
 
         try:
             parsed_tuple = imaplib.Internaldate2tuple(raw)
         except Exception:
-            parsed_dt = parsedate_to_datetime(
-                raw.decode() if isinstance(raw, bytes) else str(raw)
-            )
+            parsed_dt = parsedate_to_datetime(raw.decode())
 
         if parsed_dt is not None:
             return (
@@ -176,8 +333,25 @@ class ImapLibSession:
         if not ids or self._conn is None:
             return
 
-        await self._run_checked("store", ",".join(ids), "+FLAGS", "\\Deleted")
-        await self._run_checked("expunge")
+        await anyio.to_thread.run_sync(self._delete_messages, ids)
+
+    def _delete_messages(self, ids: list[str]) -> None:
+        uid_set = ",".join(ids)
+        self._call("uid", "STORE", uid_set, "+FLAGS", "\\Deleted")
+        # UID EXPUNGE (RFC 4315) only removes our messages, leaving anything
+        # another client flagged alone; plain EXPUNGE is the fallback.
+        if "UIDPLUS" in getattr(self._conn, "capabilities", ()):
+            self._call("uid", "EXPUNGE", uid_set)
+        else:
+            self._call("expunge")
+
+    async def ping(self) -> bool:
+        """Check with NOOP that a pooled connection is still usable."""
+        try:
+            await anyio.to_thread.run_sync(self._call, "noop")
+        except Exception:
+            return False
+        return True
 
 
 class ImapCheckExecutor:
@@ -186,13 +360,16 @@ class ImapCheckExecutor:
     def __init__(
         self,
         session_factory: Callable[[str, ImapCheckConfig], ImapSession] | None = None,
+        pool: ImapSessionPool | None = None,
     ) -> None:
         self._session_factory = session_factory or ImapLibSession
+        # The pool is owned (and closed) by the runner; without one every
+        # check opens and logs out its own session.
+        self._pool = pool
 
     async def execute(self, check: Check) -> Result:
         try:
-            config = ImapCheckConfig.from_dict(check.data)
-            config.validate()
+            config = load_config(ImapCheckConfig, check.data)
         except ValueError as err:
             return Result(
                 check_id=check.check_id,
@@ -209,7 +386,7 @@ class ImapCheckExecutor:
                 return await self._run_once(check, config)
             except ImapNoRecentMessage as err:
                 if attempt < config.retries:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt)
                     continue
                 return self._error_result(
                     check.check_id,
@@ -225,7 +402,7 @@ class ImapCheckExecutor:
                 )
             except ImapTransientError as err:
                 if attempt < config.retries:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt)
                     continue
                 return self._error_result(
                     check.check_id, "transient_failure", str(err), attempt + 1
@@ -245,33 +422,74 @@ class ImapCheckExecutor:
 
     async def _run_once(self, check: Check, config: ImapCheckConfig) -> Result:
         host = self._normalize_host(config.host or check.url)
-        session = self._session_factory(host, config)
-        async with session:
-            messages = await session.search_recent(
-                config.search_subject, config.max_age_minutes
-            )
+        # A session parked for longer than idle_timeout is reaped before the
+        # next check comes around, so pooling would only add logouts.
+        if self._pool is None or check.check_interval >= self._pool.idle_timeout:
+            async with self._session_factory(host, config) as session:
+                return await self._check_session(session, check, config)
+
+        key: SessionKey = (
+            host,
+            config.port,
+            config.tls_mode,
+            config.username,
+            config.password,
+            config.folder,
+            config.timeout,
+        )
+        pooled = await self._pool.acquire(key)
+        if pooled is None:
+            session = self._session_factory(host, config)
+            await session.__aenter__()
+        else:
+            session = pooled
 
-            if not messages:
-                raise ImapNoRecentMessage(
-                    f"No messages with subject '{config.search_subject}' within {config.max_age_minutes} minutes",
-                )
+        try:
+            result = await self._check_session(session, check, config)
+        except ImapNoRecentMessage:
+            # The connection is fine, there just is no mail yet
+            await self._pool.release(key, session)
+            raise
+        except BaseException as err:
+            with anyio.CancelScope(shield=True):
+                await session.__aexit__(type(err), err, err.__traceback__)
+            raise
+
+        await self._pool.release(key, session)
+        return result
+
+    async def _check_session(
+        self, session: ImapSession, check: Check, config: ImapCheckConfig
+    ) -> Result:
+        # Without deletion only the newest match matters, so skip the rest
+        search = (
+            session.search_recent
+            if config.delete_after_check
+            else session.search_latest
+        )
+        messages = await search(config.search_subject, config.max_age_minutes)
 
-            # Sort to ensure deterministic latest selection
-            messages.sort(key=lambda m: m.internaldate)
-            matched_uids = [m.uid for m in messages]
-            latest = messages[-1]
+        if not messages:
+            raise ImapNoRecentMessage(
+                f"No messages with subject '{config.search_subject}' within {config.max_age_minutes} minutes",
+            )
 
-            if config.delete_after_check:
-                await session.delete_messages(matched_uids)
+        # Sort to ensure deterministic latest selection
+        messages.sort(key=lambda m: m.internaldate)
+        matched_uids = [m.uid for m in messages]
+        latest = messages[-1]
 
-            return Result(
-                check_id=check.check_id,
-                status=ResultStatus.OK,
-                data={
-                    "matched_uids": matched_uids,
-                    "latest_internaldate": latest.internaldate.isoformat(),
-                },
-            )
+        if config.delete_after_check:
+            await session.delete_messages(matched_uids)
+
+        return Result(
+            check_id=check.check_id,
+            status=ResultStatus.OK,
+            data={
+                "matched_uids": matched_uids,
+                "latest_internaldate": latest.internaldate.isoformat(),
+            },
+        )
 
     def _error_result(
         self,
@@ -298,7 +516,11 @@ class ImapCheckExecutor:
         )
 
     async def aclose(self) -> None:
-        """Executor cleanup hook (no resources to release)."""
+        """Executor cleanup hook.
+
+        Pooled sessions deliberately outlive the executor, since the runner
+        builds a new one for every batch; the runner closes the pool itself.
+        """
         return None
 
     def _normalize_host(self, host: str) -> str:
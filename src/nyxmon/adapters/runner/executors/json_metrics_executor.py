@@ -3,26 +3,67 @@
 from __future__ import annotations
 
 import json
-import anyio
-import operator
 import re
+import anyio
 import time
-from typing import Any, Callable, Optional
+from functools import lru_cache
+from typing import Any, Optional
+from urllib.parse import urlsplit
 
 import httpx
+import orjson
 
 from ....domain import Check, Result, ResultStatus
-from ....domain.json_metrics_config import JsonMetricsCheckConfig
+from ....domain.json_metrics_config import (
+    JsonMetricsCheckConfig,
+    PathPart,
+    compile_path,
+)
+from .config_cache import load_config
+from .retry import sleep_before_retry
+from .http_executor import create_http_client
+
+# Integer literals of 19+ digits may not fit in 64 bits, which orjson would
+# silently decode as floats
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a metrics body with orjson, with the semantics of ``json.loads``.
 
+    Bodies orjson handles differently (NaN/Infinity, integers beyond 64 bits)
+    are decoded by the stdlib instead.
+    """
+    if _LONG_DIGITS_RE.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+_MISSING = object()
 
-OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
-    "<": operator.lt,
-    "<=": operator.le,
-    ">": operator.gt,
-    ">=": operator.ge,
-    "==": operator.eq,
-    "!=": operator.ne,
-}
+
+@lru_cache(maxsize=64)
+def _basic_auth(username: str, password: str) -> httpx.BasicAuth:
+    """Share one BasicAuth (and its encoded header) per credential pair."""
+    return httpx.BasicAuth(username, password)
+
+
+def _walk(payload: Any, parts: tuple[PathPart, ...]) -> Any:
+    """Walk a payload along precompiled path parts, returning None if missing."""
+    current = payload
+    for key, index in parts:
+        if isinstance(current, dict):
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return None
+        elif index is not None and isinstance(current, list):
+            current = current[index] if index < len(current) else None
+        else:
+            return None
+    return current
 
 
 class JsonMetricsError(Exception):
@@ -32,60 +73,111 @@ class JsonMetricsError(Exception):
 class JsonMetricsExecutor:
     """Executor for JSON metrics checks."""
 
-    def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_host_concurrency: int = 4,
+    ) -> None:
         self._client = client
         self._owns_client = client is None
         self._created_client: Optional[httpx.AsyncClient] = None
+        # The runner starts every due check at once; cap requests per host so
+        # a burst of metrics checks against one exporter reuses a few pooled
+        # connections instead of opening one each.
+        self.max_host_concurrency = max_host_concurrency
+        self._host_limiters: dict[str, anyio.CapacityLimiter] = {}
+
+    def _host_limiter(self, url: str) -> anyio.CapacityLimiter:
+        host = urlsplit(url).netloc
+        limiter = self._host_limiters.get(host)
+        if limiter is None:
+            limiter = anyio.CapacityLimiter(self.max_host_concurrency)
+            self._host_limiters[host] = limiter
+        return limiter
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client:
             return self._client
 
         if self._created_client is None:
-            self._created_client = httpx.AsyncClient(follow_redirects=True)
+            self._created_client = create_http_client()
         return self._created_client
 
+    async def _fetch(
+        self,
+        client: httpx.AsyncClient,
+        config: JsonMetricsCheckConfig,
+        auth: Optional[httpx.Auth],
+    ) -> tuple[int, bytes | None]:
+        """GET the metrics URL, reading at most ``max_body_bytes`` of the body.
+
+        The body is None when it exceeds the limit, judged by Content-Length
+        up front or by the bytes streamed so far, so an oversized payload is
+        neither downloaded in full nor decoded.
+        """
+        async with client.stream(
+            "GET", config.url, timeout=config.timeout, auth=auth
+        ) as response:
+            if response.status_code >= 400:
+                return response.status_code, b""
+            declared = response.headers.get("content-length", "")
+            if declared.isdigit() and int(declared) > config.max_body_bytes:
+                return response.status_code, None
+
+            chunks: list[bytes] = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > config.max_body_bytes:
+                    return response.status_code, None
+                chunks.append(chunk)
+            return response.status_code, b"".join(chunks)
+
     async def execute(self, check: Check) -> Result:
         try:
-            config = JsonMetricsCheckConfig.from_dict(check.data)
-            config.validate()
+            config = load_config(JsonMetricsCheckConfig, check.data)
         except ValueError as err:
             return self._error(check.check_id, "configuration_error", str(err))
 
         client = await self._get_client()
+        auth = self._build_auth(config)
+        limiter = self._host_limiter(config.url)
         attempts = config.retries + 1
         last_error: Result | None = None
 
         for attempt in range(attempts):
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
-                response = await client.get(
-                    config.url,
-                    timeout=config.timeout,
-                    auth=self._build_auth(config),
-                )
-                if response.status_code >= 400:
+                async with limiter:
+                    status_code, content = await self._fetch(client, config, auth)
+                if status_code >= 400:
                     last_error = self._error(
-                        check.check_id, "http_error", f"HTTP {response.status_code}"
+                        check.check_id, "http_error", f"HTTP {status_code}"
                     )
                     if (
-                        self._is_retryable_status(response.status_code)
+                        self._is_retryable_status(status_code)
                         and attempt < config.retries
                     ):
-                        await anyio.sleep(config.retry_delay)
+                        await sleep_before_retry(config.retry_delay, attempt)
                         continue
                     return last_error
-                body = response.json()
+                if content is None:
+                    return self._error(
+                        check.check_id,
+                        "payload_too_large",
+                        f"Response body exceeds max_body_bytes={config.max_body_bytes}",
+                    )
+                body = _json_loads(content)
             except httpx.TimeoutException as err:
                 last_error = self._error(check.check_id, "timeout", str(err))
                 if attempt < config.retries:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt)
                     continue
                 return last_error
             except httpx.RequestError as err:
                 last_error = self._error(check.check_id, "request_error", str(err))
                 if attempt < config.retries:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt)
                     continue
                 return last_error
             except (json.JSONDecodeError, ValueError) as err:
@@ -93,7 +185,7 @@ class JsonMetricsExecutor:
             except Exception as err:  # noqa: BLE001
                 return self._error(check.check_id, "unexpected_error", str(err))
 
-            duration_ms = int((time.time() - start) * 1000)
+            duration_ms = (time.perf_counter_ns() - start) // 1_000_000
             failures = self._evaluate(body, config)
             if failures:
                 # Determine highest severity: if any critical failure, use ERROR; else WARNING
@@ -124,18 +216,17 @@ class JsonMetricsExecutor:
 
     def _build_auth(self, config: JsonMetricsCheckConfig):
         if config.auth:
-            return httpx.BasicAuth(config.auth["username"], config.auth["password"])
+            return _basic_auth(config.auth["username"], config.auth["password"])
         return None
 
     def _evaluate(self, payload: Any, config: JsonMetricsCheckConfig) -> list[dict]:
         failures: list[dict] = []
         for chk in config.checks:
-            actual = self._resolve_path(payload, chk.path)
-            comparator = OPERATORS[chk.op]
-            ok = False
+            actual = _walk(payload, chk.parts)
             try:
-                ok = comparator(actual, chk.value)
-            except Exception:
+                ok = chk.comparator(actual, chk.value)
+            except TypeError:
+                # Missing paths (None) or mismatched types don't order
                 ok = False
 
             if not ok:
@@ -152,21 +243,7 @@ class JsonMetricsExecutor:
 
     def _resolve_path(self, payload: Any, path: str) -> Any:
         """Minimal path resolver for dotted paths like $.a.b.c."""
-        if path == "$":
-            return payload
-
-        normalized = re.sub(r"\[(\d+)\]", r".\1", path)
-        parts = [p for p in normalized.replace("$.", "").split(".") if p]
-        current = payload
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            elif isinstance(current, list) and part.isdigit():
-                idx = int(part)
-                current = current[idx] if 0 <= idx < len(current) else None
-            else:
-                return None
-        return current
+        return _walk(payload, compile_path(path))
 
     async def aclose(self) -> None:
         if self._owns_client and self._created_client:
@@ -0,0 +1,29 @@
+"""Shared retry backoff for check executors."""
+
+import random
+
+import anyio
+
+# Upper bound for grown delays; configured delays above it are kept as-is
+MAX_BACKOFF = 30.0
+
+
+def backoff_delay(base_delay: float, retry: int) -> float:
+    """Return the delay before retry number ``retry`` (0-based).
+
+    The first retry waits exactly ``base_delay``. Later ones double the delay
+    and add up to ``base_delay`` of jitter so checks failing together don't
+    retry in lockstep. Delays only grow up to ``MAX_BACKOFF``, so long
+    configured delays (e.g. SMTP greylisting) are honoured unchanged.
+    """
+    if base_delay <= 0:
+        return 0.0
+    if retry == 0:
+        return base_delay
+    cap = max(base_delay, MAX_BACKOFF)
+    return min(base_delay * 2**retry + random.uniform(0, base_delay), cap)
+
+
+async def sleep_before_retry(base_delay: float, retry: int) -> None:
+    """Sleep for the backoff delay of retry number ``retry`` (0-based)."""
+    await anyio.sleep(backoff_delay(base_delay, retry))
@@ -1,19 +1,23 @@
 """SMTP check executor implementation."""
 
 import datetime as dt
-import secrets
+import os
 import smtplib
 import socket
 import ssl
 from dataclasses import dataclass
+from email import policy
 from email.message import EmailMessage
 from email.utils import make_msgid
+from functools import lru_cache
 from typing import Protocol
 
 import anyio
 
 from ....domain import Check, Result, ResultStatus
 from ....domain.smtp_config import SmtpCheckConfig
+from .config_cache import load_config
+from .retry import sleep_before_retry
 
 
 @dataclass
@@ -69,11 +73,31 @@ def _is_temporary(code: int | None) -> bool:
     return bool(code and 400 <= code < 500)
 
 
+@lru_cache(maxsize=128)
+def _address_header(name: str, value: str):
+    """Parse an address header once per value; header objects are immutable."""
+    return policy.default.header_factory(name, value)
+
+
+@lru_cache(maxsize=128)
+def _message_id_domain(from_addr: str) -> str:
+    """Derive a Message-ID domain from the sender address with a safe fallback."""
+    if "@" in from_addr:
+        return from_addr.split("@", 1)[1]
+    return "nyxmon.local"
+
+
+@lru_cache(maxsize=1)
+def _default_ssl_context() -> ssl.SSLContext:
+    """Load the system CA bundle once; the runner rebuilds clients per batch."""
+    return ssl.create_default_context()
+
+
 class SmtplibClient:
     """SMTP client backed by Python's smtplib (run in a worker thread)."""
 
     def __init__(self) -> None:
-        self._ssl_context = ssl.create_default_context()
+        self._ssl_context = _default_ssl_context()
 
     async def send_mail(
         self, config: SmtpCheckConfig, message: EmailMessage
@@ -168,8 +192,7 @@ class SmtpCheckExecutor:
 
     async def execute(self, check: Check) -> Result:
         try:
-            config = SmtpCheckConfig.from_dict(check.data)
-            config.validate()
+            config = load_config(SmtpCheckConfig, check.data)
         except ValueError as exc:
             return Result(
                 check_id=check.check_id,
@@ -202,7 +225,7 @@ class SmtpCheckExecutor:
                 )
             except SmtpSendError as err:
                 if err.temporary and attempt < config.retries:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt)
                     continue
 
                 error_data = {
@@ -249,7 +272,7 @@ class SmtpCheckExecutor:
             .isoformat()
             .replace("+00:00", "Z")
         )
-        token = secrets.token_hex(3)
+        token = os.urandom(3).hex()
         subject = f"{prefix} {timestamp} {token}".strip()
         return subject, token
 
@@ -257,23 +280,16 @@ class SmtpCheckExecutor:
         self, config: SmtpCheckConfig, subject: str, token: str
     ) -> EmailMessage:
         message = EmailMessage()
-        message["From"] = config.from_addr
-        message["To"] = config.to_addr
+        # From/To repeat every poll; reuse their parsed headers
+        message["From"] = _address_header("From", config.from_addr)
+        message["To"] = _address_header("To", config.to_addr)
         message["Subject"] = subject
-        message["Message-ID"] = make_msgid(
-            domain=self._message_id_domain(config.from_addr)
-        )
+        message["Message-ID"] = make_msgid(domain=_message_id_domain(config.from_addr))
         message.set_content(
             f"Nyxmon SMTP health check. Correlation token: {token}. Safe to delete."
         )
         return message
 
-    def _message_id_domain(self, from_addr: str) -> str:
-        """Derive a Message-ID domain from the sender address with a safe fallback."""
-        if "@" in from_addr:
-            return from_addr.split("@", 1)[1]
-        return "nyxmon.local"
-
     async def aclose(self) -> None:
         """Cleanup the underlying SMTP client if needed."""
         if hasattr(self._client, "aclose"):
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import calendar
 import ssl
-import tempfile
 import time
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from typing import Any, Callable, Optional, Union
 from urllib.parse import urlparse
 
@@ -16,6 +16,8 @@ from anyio.streams.tls import TLSAttribute, TLSStream
 
 from ....domain import Check, Result, ResultStatus
 from ....domain.tcp_config import TcpCheckConfig
+from .config_cache import load_config
+from .retry import sleep_before_retry
 
 
 @dataclass
@@ -35,17 +37,73 @@ class TcpCheckError(Exception):
         return self.message
 
 
+@lru_cache(maxsize=2)
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    """Build each client context once; loading the CA bundle is the costly part.
+
+    Contexts are never mutated after creation, so every check can share them.
+    """
+    if verify:
+        return ssl.create_default_context()
+
+    context = ssl._create_unverified_context()  # type: ignore[attr-defined]
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _der_read(der: bytes, pos: int) -> tuple[int, int, int]:
+    """Read one DER TLV at ``pos``; return (tag, content start, content end)."""
+    tag = der[pos]
+    length = der[pos + 1]
+    pos += 2
+    if length & 0x80:
+        size = length & 0x7F
+        length = int.from_bytes(der[pos : pos + size], "big")
+        pos += size
+    return tag, pos, pos + length
+
+
+def _der_not_after(der: bytes) -> float | None:
+    """Return a DER certificate's notAfter as epoch seconds, parsed in memory.
+
+    Walks Certificate -> tbsCertificate -> validity (RFC 5280 4.1) instead of
+    round-tripping through a temp file and ssl's private decoder.
+    """
+    try:
+        _, pos, _ = _der_read(der, 0)  # Certificate
+        _, pos, _ = _der_read(der, pos)  # tbsCertificate
+        tag, _, end = _der_read(der, pos)
+        if tag == 0xA0:  # optional explicit version
+            pos = end
+        for _ in range(3):  # serialNumber, signature, issuer
+            pos = _der_read(der, pos)[2]
+        _, pos, _ = _der_read(der, pos)  # validity
+        pos = _der_read(der, pos)[2]  # notBefore
+        tag, start, end = _der_read(der, pos)  # notAfter
+        value = der[start:end].decode("ascii")
+        if tag == 0x17:  # UTCTime YYMMDDHHMMSSZ
+            year = int(value[:2])
+            value = f"{1900 + year if year >= 50 else 2000 + year}{value[2:]}"
+        elif tag != 0x18:  # GeneralizedTime YYYYMMDDHHMMSSZ
+            return None
+        parsed = time.strptime(value, "%Y%m%d%H%M%SZ")
+    except (IndexError, UnicodeDecodeError, ValueError):
+        return None
+    return float(calendar.timegm(parsed))
+
+
 class TcpCheckExecutor:
     """Executor for TCP checks including TLS handshake and cert expiry validation."""
 
-    def __init__(self, clock: Callable[[], float] | None = None) -> None:
-        self._clock = clock or time.monotonic
+    def __init__(self, clock: Callable[[], int] | None = None) -> None:
+        # Nanosecond monotonic clock; durations are integer-divided to ms
+        self._clock = clock or time.perf_counter_ns
 
     async def execute(self, check: Check) -> Result:
         """Execute a TCP check and return a Result."""
         try:
-            config = TcpCheckConfig.from_dict(check.data)
-            config.validate()
+            config = load_config(TcpCheckConfig, check.data)
         except ValueError as exc:
             return self._error(
                 check.check_id,
@@ -67,7 +125,8 @@ class TcpCheckExecutor:
         for attempt in range(1, attempts + 1):
             try:
                 data = await self._attempt_once(host, config)
-                data.update({"attempt": attempt, "attempts": attempts})
+                data["attempt"] = attempt
+                data["attempts"] = attempts
                 return Result(
                     check_id=check.check_id, status=ResultStatus.OK, data=data
                 )
@@ -85,7 +144,7 @@ class TcpCheckExecutor:
                     error_data.update(exc.data)
 
                 if exc.retryable and attempt < attempts:
-                    await anyio.sleep(config.retry_delay)
+                    await sleep_before_retry(config.retry_delay, attempt - 1)
                     continue
 
                 return Result(
@@ -157,22 +216,17 @@ class TcpCheckExecutor:
                             },
                         )
 
-            return {
+            data: dict[str, Any] = {
                 "host": host,
                 "port": config.port,
                 "tls_mode": config.tls_mode,
                 "connect_time_ms": connect_time_ms,
-                **(
-                    {"tls_handshake_ms": tls_handshake_ms}
-                    if tls_handshake_ms is not None
-                    else {}
-                ),
-                **(
-                    {"cert_days_remaining": cert_days_remaining}
-                    if cert_days_remaining is not None
-                    else {}
-                ),
             }
+            if tls_handshake_ms is not None:
+                data["tls_handshake_ms"] = tls_handshake_ms
+            if cert_days_remaining is not None:
+                data["cert_days_remaining"] = cert_days_remaining
+            return data
         finally:
             await current_stream.aclose()
 
@@ -198,7 +252,7 @@ class TcpCheckExecutor:
                 retryable=True,
             ) from exc
 
-        connect_time_ms = int((self._clock() - start) * 1000)
+        connect_time_ms = (self._clock() - start) // 1_000_000
         return stream, connect_time_ms
 
     async def _negotiate_tls(
@@ -232,7 +286,7 @@ class TcpCheckExecutor:
                 retryable=True,
             ) from exc
 
-        tls_handshake_ms = int((self._clock() - start) * 1000)
+        tls_handshake_ms = (self._clock() - start) // 1_000_000
         peer_cert: Any = tls_stream.extra(TLSAttribute.peer_certificate_binary)
         if not peer_cert:
             peer_cert = tls_stream.extra(TLSAttribute.peer_certificate)
@@ -254,8 +308,9 @@ class TcpCheckExecutor:
                 retryable=True,
             ) from exc
 
-        response_text = response.decode(errors="ignore").strip()
-        if not self._is_positive_starttls_response(response_text):
+        if not self._is_positive_starttls_response(response):
+            # Only the rejection path needs the banner as text
+            response_text = response.decode(errors="ignore").strip()
             raise TcpCheckError(
                 "starttls_rejected",
                 f"STARTTLS rejected: {response_text or 'no response'}",
@@ -264,15 +319,8 @@ class TcpCheckExecutor:
             )
 
     def _build_ssl_context(self, config: TcpCheckConfig) -> ssl.SSLContext:
-        """Create an SSL context based on verification requirements."""
-        if config.verify:
-            context = ssl.create_default_context()
-        else:
-            context = ssl._create_unverified_context()  # type: ignore[attr-defined]
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-
-        return context
+        """Return the shared SSL context matching verification requirements."""
+        return _ssl_context(config.verify)
 
     def _resolve_host(self, config: TcpCheckConfig, url: str) -> str | None:
         """Determine target host from config or check URL."""
@@ -282,6 +330,10 @@ class TcpCheckExecutor:
         if not url:
             return None
 
+        # Bare host values never carry a netloc, so skip the URL parser for them
+        if "//" not in url:
+            return url
+
         parsed = urlparse(url)
         if parsed.hostname:
             return parsed.hostname
@@ -293,50 +345,35 @@ class TcpCheckExecutor:
         if cert is None:
             return None
 
-        cert_dict: dict[str, Any]
-
         if isinstance(cert, (bytes, bytearray)):
-            pem_data = ssl.DER_cert_to_PEM_cert(cert)
-            # stdlib lacks a public DER-to-dict helper; _test_decode_cert is stable enough for this
-            with tempfile.NamedTemporaryFile(
-                mode="w+", suffix=".pem", delete=False
-            ) as tmp:
-                tmp.write(pem_data)
-                tmp.flush()
-                temp_path = Path(tmp.name)
-
-            try:
-                cert_dict = ssl._ssl._test_decode_cert(str(temp_path))  # type: ignore[attr-defined]
-            finally:
-                temp_path.unlink(missing_ok=True)
+            expires_at = _der_not_after(bytes(cert))
+            if expires_at is None:
+                return None
         elif isinstance(cert, dict):
-            cert_dict = cert
+            not_after = cert.get("notAfter")
+            if not not_after:
+                return None
+            expires_at = ssl.cert_time_to_seconds(not_after)
         else:
             return None
 
-        not_after = cert_dict.get("notAfter")
-        if not not_after:
-            return None
-
-        expires_at = ssl.cert_time_to_seconds(not_after)
         seconds_remaining = expires_at - time.time()
         return int(seconds_remaining // 86400)
 
-    def _is_positive_starttls_response(self, response: str) -> bool:
-        """Detect a successful STARTTLS response."""
-        normalized = response.lower()
-        numeric_code = normalized.split(" ", 1)[0]
+    def _is_positive_starttls_response(self, response: bytes) -> bool:
+        """Detect a successful STARTTLS response from the raw ASCII banner."""
+        response = response.strip()
+        numeric_code = response.split(b" ", 1)[0]
         if numeric_code.isdigit():
-            return numeric_code.startswith("2")
+            return numeric_code[:1] == b"2"
 
-        return normalized.startswith("2") or "ok" in normalized
+        return response[:1] == b"2" or b"ok" in response.lower()
 
     def _error(
         self, check_id: int, error_type: str, message: str, extra: dict[str, Any]
     ) -> Result:
         """Build an error Result with standard fields."""
-        data = {"error_type": error_type, "error_msg": message}
-        data.update(extra)
+        data = {"error_type": error_type, "error_msg": message, **extra}
         return Result(check_id=check_id, status=ResultStatus.ERROR, data=data)
 
     async def aclose(self) -> None:
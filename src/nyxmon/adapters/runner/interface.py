@@ -8,5 +8,8 @@ class CheckRunner(Protocol):
     """A runner interface for executing health checks."""
 
     def run_all(self, checks: Iterable[Check], result_received: Callable) -> None:
-        """Run all checks."""
+        """Run all checks, calling ``result_received`` with each result.
+
+        The callback must be cheap and non-blocking.
+        """
         ...
@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache, partial
 
 from anyio.from_thread import BlockingPortalProvider
 
@@ -11,12 +12,18 @@ from .adapters.notification import Notifier, LoggingNotifier
 from .service_layer import handlers, UnitOfWork, MessageBus
 
 
+@lru_cache(maxsize=None)
+def _handler_params(handler) -> frozenset[str]:
+    """Parameter names of a handler; handlers are module-level, so inspect once."""
+    return frozenset(inspect.signature(handler).parameters)
+
+
 def inject_dependencies(handler, dependencies):
-    params = inspect.signature(handler).parameters
+    params = _handler_params(handler)
     deps = {
         name: dependency for name, dependency in dependencies.items() if name in params
     }
-    return lambda message: handler(message, **deps)
+    return partial(handler, **deps)
 
 
 def bootstrap(
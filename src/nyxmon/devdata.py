@@ -3,7 +3,22 @@ Development data utilities for the nyxmon project.
 This module contains functions for creating test or demo data.
 """
 
-from nyxmon.domain.models import Result, ResultStatus
+from nyxmon.domain.models import Result, ResultStatus, ResultStatusType
+
+
+def _build_results(
+    first_id: int, count: int, check_id: int, status: ResultStatusType, label: str
+) -> list[Result]:
+    """Create ``count`` results with consecutive ids starting at ``first_id``."""
+    return [
+        Result(
+            result_id=first_id + i,
+            check_id=check_id,
+            status=status,
+            data={"message": f"{label} {i}"},
+        )
+        for i in range(count)
+    ]
 
 
 def create_test_results(num_recent=5, num_old=5, num_very_old=5):
@@ -24,39 +39,16 @@ def create_test_results(num_recent=5, num_old=5, num_very_old=5):
             'all': [All Result objects]
         }
     """
-    results = {"recent": [], "old": [], "very_old": [], "all": []}
-
-    # Create recent results (would be from 10 minutes ago)
-    for i in range(num_recent):
-        result = Result(
-            result_id=i + 1,
-            check_id=101,
-            status=ResultStatus.OK,
-            data={"message": f"recent {i}"},
-        )
-        results["recent"].append(result)
-        results["all"].append(result)
-
-    # Create old results (would be from 25 hours ago)
-    for i in range(num_old):
-        result = Result(
-            result_id=i + 101,
-            check_id=102,
-            status=ResultStatus.ERROR,
-            data={"message": f"old {i}"},
-        )
-        results["old"].append(result)
-        results["all"].append(result)
-
-    # Create very old results (would be from 48 hours ago)
-    for i in range(num_very_old):
-        result = Result(
-            result_id=i + 201,
-            check_id=103,
-            status=ResultStatus.OK,
-            data={"message": f"very old {i}"},
-        )
-        results["very_old"].append(result)
-        results["all"].append(result)
-
-    return results
+    # Recent results (would be from 10 minutes ago)
+    recent = _build_results(1, num_recent, 101, ResultStatus.OK, "recent")
+    # Old results (would be from 25 hours ago)
+    old = _build_results(101, num_old, 102, ResultStatus.ERROR, "old")
+    # Very old results (would be from 48 hours ago)
+    very_old = _build_results(201, num_very_old, 103, ResultStatus.OK, "very old")
+
+    return {
+        "recent": recent,
+        "old": old,
+        "very_old": very_old,
+        "all": recent + old + very_old,
+    }
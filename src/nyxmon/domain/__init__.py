@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .events import Event
 from .commands import Command
 from .constants import Auto
@@ -12,11 +15,23 @@ from .models import (
     ResultStatusType,
     StatusChoices,
 )
-from .imap_config import ImapCheckConfig
-from .smtp_config import SmtpCheckConfig
-from .http_config import HttpCheckConfig
-from .json_metrics_config import JsonMetricsCheckConfig
-from .tcp_config import TcpCheckConfig
+
+if TYPE_CHECKING:
+    from .http_config import HttpCheckConfig
+    from .imap_config import ImapCheckConfig
+    from .json_metrics_config import JsonMetricsCheckConfig
+    from .smtp_config import SmtpCheckConfig
+    from .tcp_config import TcpCheckConfig
+
+# Check configs are imported on first access so consumers that only need the
+# models don't pay for every config module
+_LAZY_CONFIGS = {
+    "HttpCheckConfig": "http_config",
+    "ImapCheckConfig": "imap_config",
+    "JsonMetricsCheckConfig": "json_metrics_config",
+    "SmtpCheckConfig": "smtp_config",
+    "TcpCheckConfig": "tcp_config",
+}
 
 
 __all__ = [
@@ -38,3 +53,12 @@ __all__ = [
     "JsonMetricsCheckConfig",
     "TcpCheckConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_CONFIGS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
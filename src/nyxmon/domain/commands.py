@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 from .models import Check, CheckResult
 
@@ -6,15 +7,17 @@ from .models import Check, CheckResult
 class Command:
     """Base class for all commands."""
 
+    __slots__ = ()
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecuteChecks(Command):
     """Run all pending checks."""
 
-    checks: list[Check] = field(default_factory=list)
+    checks: Sequence[Check] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class RegisterCheck(Command):
     """Register a check."""
 
@@ -23,49 +26,56 @@ class RegisterCheck(Command):
     check_data: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteCheck(Command):
     """Delete a check."""
 
     check_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AddCheck(Command):
     """Add a check."""
 
     check: Check
 
 
-@dataclass
+@dataclass(slots=True)
 class AddCheckResult(Command):
     """Add a result for a check."""
 
     check_result: CheckResult
 
 
-@dataclass
+@dataclass(slots=True)
+class AddCheckResults(Command):
+    """Add the results of one batch of checks together."""
+
+    check_results: Sequence[CheckResult]
+
+
+@dataclass(slots=True)
 class StartCollector(Command):
     """Start the collector."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StopCollector(Command):
     """Stop the collector."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StartCleaner(Command):
     """Start the results cleaner."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StopCleaner(Command):
     """Stop the results cleaner."""
 
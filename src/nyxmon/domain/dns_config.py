@@ -1,11 +1,11 @@
 """DNS check configuration domain model."""
 
 import ipaddress
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
 
 
-VALID_QUERY_TYPES = {"A", "AAAA", "MX", "TXT", "CNAME", "NS", "SOA", "PTR"}
+VALID_QUERY_TYPES = frozenset({"A", "AAAA", "MX", "TXT", "CNAME", "NS", "SOA", "PTR"})
+_QUERY_TYPE_CHOICES = ", ".join(sorted(VALID_QUERY_TYPES))
 
 
 @dataclass
@@ -18,13 +18,20 @@ class DnsCheckConfig:
         source_ip: Source IP address to bind for the query (not interface name)
         query_type: DNS record type (default: "A")
         timeout: Query timeout in seconds (default: 5.0)
+        expected_ips_set: Frozen view of expected_ips for membership tests
     """
 
-    expected_ips: List[str]
-    dns_server: Optional[str] = None
-    source_ip: Optional[str] = None
+    expected_ips: list[str]
+    dns_server: str | None = None
+    source_ip: str | None = None
     query_type: str = "A"
     timeout: float = 5.0
+    expected_ips_set: frozenset[str] = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+
+    def __post_init__(self) -> None:
+        self.expected_ips_set = frozenset(self.expected_ips)
 
     @classmethod
     def from_dict(cls, data: dict) -> "DnsCheckConfig":
@@ -85,7 +92,7 @@ class DnsCheckConfig:
         """
         if self.query_type not in VALID_QUERY_TYPES:
             raise ValueError(
-                f"Invalid query_type: {self.query_type}. Must be one of {VALID_QUERY_TYPES}"
+                f"Invalid query_type: {self.query_type}. Must be one of {_QUERY_TYPE_CHOICES}"
             )
 
         if self.timeout <= 0:
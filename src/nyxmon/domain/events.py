@@ -4,15 +4,17 @@ from dataclasses import dataclass
 class Event:
     """Base class for all events."""
 
+    __slots__ = ()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CheckSucceeded(Event):
     """Check succeeded."""
 
     check_id: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckFailed(Event):
     """Check failed."""
 
@@ -20,7 +22,7 @@ class CheckFailed(Event):
     result: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServiceStatusChanged(Event):
     """Service status changed."""
 
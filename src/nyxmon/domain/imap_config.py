@@ -2,8 +2,12 @@
 
 from dataclasses import dataclass
 
-ALLOWED_TLS_MODES = {"implicit", "starttls", "none"}
-ALLOWED_NO_RECENT_MESSAGE_SEVERITIES = {"critical", "warning"}
+ALLOWED_TLS_MODES = frozenset({"implicit", "starttls", "none"})
+_TLS_MODE_CHOICES = ", ".join(sorted(ALLOWED_TLS_MODES))
+ALLOWED_NO_RECENT_MESSAGE_SEVERITIES = frozenset({"critical", "warning"})
+_NO_RECENT_MESSAGE_SEVERITY_CHOICES = ", ".join(
+    sorted(ALLOWED_NO_RECENT_MESSAGE_SEVERITIES)
+)
 
 
 @dataclass
@@ -45,11 +49,11 @@ class ImapCheckConfig:
         if not search_subject:
             raise ValueError("search_subject is required")
         if tls_mode not in ALLOWED_TLS_MODES:
-            raise ValueError(f"tls_mode must be one of {ALLOWED_TLS_MODES}")
+            raise ValueError(f"tls_mode must be one of {_TLS_MODE_CHOICES}")
         if no_recent_message_severity not in ALLOWED_NO_RECENT_MESSAGE_SEVERITIES:
             raise ValueError(
                 "no_recent_message_severity must be one of "
-                f"{ALLOWED_NO_RECENT_MESSAGE_SEVERITIES}"
+                f"{_NO_RECENT_MESSAGE_SEVERITY_CHOICES}"
             )
 
         return cls(
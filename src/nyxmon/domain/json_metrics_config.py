@@ -2,12 +2,57 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-
-
-ALLOWED_OPERATORS = {"<", "<=", ">", ">=", "==", "!="}
-ALLOWED_SEVERITIES = {"warning", "critical"}
+import operator
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable
+
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+ALLOWED_OPERATORS = frozenset(OPERATORS)
+_OPERATOR_CHOICES = ", ".join(sorted(ALLOWED_OPERATORS))
+ALLOWED_SEVERITIES = frozenset({"warning", "critical"})
+_SEVERITY_CHOICES = ", ".join(sorted(ALLOWED_SEVERITIES))
+
+_BRACKET_RE = re.compile(r"\[(\d+)\]")
+
+# A path segment is its dict key plus, for numeric segments, the list index
+PathPart = tuple[str, int | None]
+
+
+@lru_cache(maxsize=512)
+def compile_path(path: str) -> tuple[PathPart, ...]:
+    """Split a path like $.a[0].b into its parts (cached, paths repeat every poll)."""
+    if path == "$":
+        return ()
+    # Normalise brackets first so a root array path like $[0].x loses its "$."
+    if "[" in path:
+        path = _BRACKET_RE.sub(r".\1", path)
+    if path.startswith("$."):
+        path = path[2:]
+    return tuple((p, int(p) if p.isdigit() else None) for p in path.split(".") if p)
+
+
+def _check_operator(op: Any) -> None:
+    if op not in ALLOWED_OPERATORS:
+        raise ValueError(f"Invalid operator {op!r}: must be one of {_OPERATOR_CHOICES}")
+
+
+def _check_rule(op: Any, severity: Any) -> None:
+    """Reject a threshold rule with an unknown operator or severity."""
+    _check_operator(op)
+    if severity not in ALLOWED_SEVERITIES:
+        raise ValueError(
+            f"Invalid severity {severity!r}: must be one of {_SEVERITY_CHOICES}"
+        )
 
 
 @dataclass
@@ -20,13 +65,25 @@ class JsonMetricsCheckConfig:
         op: str
         value: Any
         severity: str
+        # Bound from op and path once so evaluation skips the string handling
+        comparator: Callable[[Any, Any], bool] = field(
+            init=False, repr=False, compare=False
+        )
+        parts: tuple[PathPart, ...] = field(init=False, repr=False, compare=False)
+
+        def __post_init__(self) -> None:
+            # Same ValueError validate() would raise, before binding fails
+            _check_operator(self.op)
+            self.comparator = OPERATORS[self.op]
+            self.parts = compile_path(self.path)
 
     url: str
-    checks: List[Check]
+    checks: list[Check]
     timeout: float = 10.0
-    auth: Optional[Dict[str, str]] = None
+    auth: dict[str, str] | None = None
     retries: int = 1
     retry_delay: float = 2.0
+    max_body_bytes: int = 1_048_576
 
     @classmethod
     def from_dict(cls, data: dict) -> "JsonMetricsCheckConfig":
@@ -42,11 +99,7 @@ class JsonMetricsCheckConfig:
         for entry in raw_checks:
             op = entry.get("op")
             severity = entry.get("severity")
-            if op not in ALLOWED_OPERATORS:
-                raise ValueError(f"op must be one of {ALLOWED_OPERATORS}")
-            if severity not in ALLOWED_SEVERITIES:
-                raise ValueError(f"severity must be one of {ALLOWED_SEVERITIES}")
-
+            _check_rule(op, severity)
             checks.append(
                 cls.Check(
                     path=entry.get("path", ""),
@@ -68,6 +121,7 @@ class JsonMetricsCheckConfig:
             checks=checks,
             retries=int(data.get("retries", 1)),
             retry_delay=float(data.get("retry_delay", 2.0)),
+            max_body_bytes=int(data.get("max_body_bytes", 1_048_576)),
         )
 
     def to_dict(self) -> dict:
@@ -77,6 +131,7 @@ class JsonMetricsCheckConfig:
             "auth": self.auth,
             "retries": self.retries,
             "retry_delay": self.retry_delay,
+            "max_body_bytes": self.max_body_bytes,
             "checks": [
                 {"path": c.path, "op": c.op, "value": c.value, "severity": c.severity}
                 for c in self.checks
@@ -90,13 +145,12 @@ class JsonMetricsCheckConfig:
             raise ValueError("retries must be zero or positive")
         if self.retry_delay < 0:
             raise ValueError("retry_delay must be zero or positive")
+        if self.max_body_bytes <= 0:
+            raise ValueError("max_body_bytes must be positive")
 
         for check in self.checks:
             if check.path == "":
                 raise ValueError("check.path is required")
-            if check.op not in ALLOWED_OPERATORS:
-                raise ValueError(f"Invalid operator {check.op}")
-            if check.severity not in ALLOWED_SEVERITIES:
-                raise ValueError(f"Invalid severity {check.severity}")
+            _check_rule(check.op, check.severity)
 
         return True
@@ -14,28 +14,47 @@ ResultStatusType: TypeAlias = Literal["ok", "warning", "error"]
 
 
 class StatusChoices:
+    __slots__ = ()
+
     PASSED: Literal["passed"] = "passed"
     FAILED: Literal["failed"] = "failed"
     WARNING: Literal["warning"] = "warning"
     RECOVERING: Literal["recovering"] = "recovering"
     UNKNOWN: Literal["unknown"] = "unknown"
 
+    _CSS_CLASSES = {
+        PASSED: "status-passed",
+        FAILED: "status-failed",
+        WARNING: "status-warning",
+        RECOVERING: "status-recovering",
+        UNKNOWN: "status-unknown",
+    }
+
     @classmethod
     def get_css_class(cls, status: str) -> str:
-        css_classes = {
-            cls.PASSED: "status-passed",
-            cls.FAILED: "status-failed",
-            cls.WARNING: "status-warning",
-            cls.RECOVERING: "status-recovering",
-            cls.UNKNOWN: "status-unknown",
-        }
-        return css_classes.get(status, "")
+        return cls._CSS_CLASSES.get(status, "")
 
 
 StatusType: TypeAlias = Literal["passed", "failed", "warning", "recovering", "unknown"]
 
 
-class Result:
+class _EventSource:
+    """Holds domain events, allocating the list only once one is recorded."""
+
+    __slots__ = ("_events",)
+
+    _events: list["Event"] | None
+
+    @property
+    def events(self) -> list["Event"]:
+        if self._events is None:
+            self._events = []
+        return self._events
+
+
+class Result(_EventSource):
+    __slots__ = ("result_id", "check_id", "status", "data")
+
     def __init__(
         self,
         *,
@@ -48,7 +67,7 @@ class Result:
         self.check_id = check_id
         self.status = status
         self.data = data
-        self.events: list["Event"] = []
+        self._events: list["Event"] | None = None
 
     def __repr__(self) -> str:
         return f"Result(result_id={self.result_id}, check_id={self.check_id} status={self.status}, data={self.data})"
@@ -85,7 +104,22 @@ CheckTypeType: TypeAlias = Literal[
 ]
 
 
-class Check:
+class Check(_EventSource):
+    __slots__ = (
+        "check_id",
+        "service_id",
+        "name",
+        "check_type",
+        "url",
+        "check_interval",
+        "next_check_time",
+        "processing_started_at",
+        "status",
+        "disabled",
+        "data",
+        "result",
+    )
+
     def __init__(
         self,
         *,
@@ -112,7 +146,7 @@ class Check:
         self.status = status
         self.disabled = disabled
         self.data = data
-        self.events: list["Event"] = []
+        self._events: list["Event"] | None = None
 
         # Will be populated when check is executed
         self.result: "Result" = None  # type: ignore
@@ -133,11 +167,13 @@ class Check:
         self.processing_started_at = 0
 
 
-class CheckResult:
+class CheckResult(_EventSource):
+    __slots__ = ("check", "result")
+
     def __init__(self, check: Check, result: Result) -> None:
         self.check = check
         self.result = result
-        self.events: list["Event"] = []
+        self._events: list["Event"] | None = None
 
     @property
     def passed(self) -> bool:
@@ -148,8 +184,10 @@ class CheckResult:
         return self.result.status in (ResultStatus.ERROR, ResultStatus.WARNING)
 
 
-class Service:
+class Service(_EventSource):
+    __slots__ = ("service_id", "data")
+
     def __init__(self, *, service_id: int, data: dict) -> None:
         self.service_id = service_id
         self.data = data
-        self.events: list["Event"] = []
+        self._events: list["Event"] | None = None
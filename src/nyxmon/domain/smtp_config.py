@@ -1,11 +1,12 @@
 """SMTP check configuration domain model."""
 
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import Literal
 
 
 TLSMode = Literal["none", "starttls", "implicit"]
-VALID_TLS_MODES: set[TLSMode] = {"none", "starttls", "implicit"}
+VALID_TLS_MODES: frozenset[TLSMode] = frozenset({"none", "starttls", "implicit"})
+_TLS_MODE_CHOICES = ", ".join(sorted(VALID_TLS_MODES))
 
 
 @dataclass
@@ -15,9 +16,9 @@ class SmtpCheckConfig:
     host: str
     port: int = 587
     tls: TLSMode = "starttls"
-    username: Optional[str] = None
-    password: Optional[str] = None
-    password_secret: Optional[str] = None
+    username: str | None = None
+    password: str | None = None
+    password_secret: str | None = None
     from_addr: str = ""
     to_addr: str = ""
     subject_prefix: str = "[nyxmon]"
@@ -50,7 +51,7 @@ class SmtpCheckConfig:
         """Validate the configuration."""
         if self.tls not in VALID_TLS_MODES:
             raise ValueError(
-                f"Invalid tls mode: {self.tls}. Must be one of {sorted(VALID_TLS_MODES)}"
+                f"Invalid tls mode: {self.tls}. Must be one of {_TLS_MODE_CHOICES}"
             )
 
         if self.port <= 0:
@@ -81,7 +82,7 @@ class SmtpCheckConfig:
 
         return True
 
-    def get_password(self) -> Optional[str]:
+    def get_password(self) -> str | None:
         """Return the best-available password value."""
         if self.password:
             return self.password
@@ -1,10 +1,10 @@
 """TCP check configuration domain model."""
 
 from dataclasses import dataclass
-from typing import Optional
 
 
-ALLOWED_TLS_MODES = {"none", "implicit", "starttls"}
+ALLOWED_TLS_MODES = frozenset({"none", "implicit", "starttls"})
+_TLS_MODE_CHOICES = ", ".join(sorted(ALLOWED_TLS_MODES))
 
 
 @dataclass
@@ -14,7 +14,7 @@ class TcpCheckConfig:
     MAX_PORT = 65535
 
     port: int
-    host: Optional[str] = None
+    host: str | None = None
     tls_mode: str = "none"
     connect_timeout: float = 10.0
     tls_handshake_timeout: float = 10.0
@@ -22,7 +22,7 @@ class TcpCheckConfig:
     retry_delay: float = 0.0
     check_cert_expiry: bool = False
     min_cert_days: int = 14
-    sni: Optional[str] = None
+    sni: str | None = None
     starttls_command: str = "STARTTLS\r\n"
     verify: bool = True
 
@@ -76,7 +76,7 @@ class TcpCheckConfig:
             raise ValueError(f"port must be between 1 and {self.MAX_PORT}")
 
         if self.tls_mode not in ALLOWED_TLS_MODES:
-            raise ValueError(f"tls_mode must be one of {sorted(ALLOWED_TLS_MODES)}")
+            raise ValueError(f"tls_mode must be one of {_TLS_MODE_CHOICES}")
 
         if self.connect_timeout <= 0:
             raise ValueError("connect_timeout must be positive")
@@ -1,17 +1,12 @@
-import anyio
 import argparse
 import logging
+import signal
 import sys
-import uvloop
 
 from pathlib import Path
 
-from nyxmon.adapters.collector import running_collector, AsyncCheckCollector
-from nyxmon.adapters.cleaner import running_cleaner, AsyncResultsCleaner
-from ..bootstrap import bootstrap
-from ..adapters.repositories import SqliteStore
-from ..adapters.notification import AsyncTelegramNotifier, LoggingNotifier
-from ..startup_validation import validate_check_types
+# The agent's runtime dependencies are imported where they are first used, so
+# --help and argument or path errors return without loading them
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +18,22 @@ def setup_logging(log_level: str):
     )
 
 
-def signal_handler(agent, signum, frame):
-    logger.info(f"Received signal {signum}, shutting down...")
-    agent.stop()
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+async def wait_for_shutdown_signal():
+    """Block until SIGINT or SIGTERM is received."""
+    import anyio
+
+    with anyio.open_signal_receiver(signal.SIGINT, signal.SIGTERM) as signals:
+        async for signum in signals:
+            logger.info(f"Received signal {signum}, shutting down...")
+            return
 
 
 async def run_monitoring_services(
@@ -34,10 +42,17 @@ async def run_monitoring_services(
     cleanup_interval=3600,
     retention_period=86400,
     batch_size=1000,
+    vacuum_interval=0,
     disable_cleaner=False,
     enable_telegram=False,
 ):
     """Async function to run the monitoring services (collector and cleaner)"""
+    from nyxmon.adapters.collector import running_collector, AsyncCheckCollector
+    from nyxmon.adapters.cleaner import running_cleaner, AsyncResultsCleaner
+    from ..bootstrap import bootstrap
+    from ..adapters.notification import AsyncTelegramNotifier, LoggingNotifier
+    from ..startup_validation import validate_check_types
+
     if enable_telegram:
         notifier = AsyncTelegramNotifier()
         logger.info("Telegram notifications enabled")
@@ -52,6 +67,7 @@ async def run_monitoring_services(
             interval=cleanup_interval,
             retention_period=retention_period,
             batch_size=batch_size,
+            vacuum_interval=vacuum_interval,
         )
     else:
         cleaner = None
@@ -80,33 +96,31 @@ async def run_monitoring_services(
     uow = UnitOfWork(store=store)
     await validate_check_types(uow, runner)
 
-    if disable_cleaner:
-        # Only run the collector
-        async with running_collector(bus):
-            logger.info(f"Monitoring started with {check_interval}s check interval")
-            logger.info("Results cleaner is disabled")
+    try:
+        if disable_cleaner:
+            # Only run the collector
+            async with running_collector(bus):
+                logger.info(f"Monitoring started with {check_interval}s check interval")
+                logger.info("Results cleaner is disabled")
 
-            # Wait forever until cancelled (e.g., by Ctrl+C)
-            try:
-                await anyio.sleep_forever()
-            except BaseException:
+                await wait_for_shutdown_signal()
                 logger.info("Monitoring services shutting down...")
-                raise
-    else:
-        # Run both collector and cleaner
-        async with running_collector(bus), running_cleaner(bus):
-            logger.info("Monitoring services started:")
-            logger.info(f"- Check collector interval: {check_interval}s")
-            logger.info(
-                f"- Results cleaner interval: {cleanup_interval}s, retention: {retention_period}s"
-            )
-
-            # Wait forever until cancelled (e.g., by Ctrl+C)
-            try:
-                await anyio.sleep_forever()
-            except BaseException:
+        else:
+            # Run both collector and cleaner
+            async with running_collector(bus), running_cleaner(bus):
+                logger.info("Monitoring services started:")
+                logger.info(f"- Check collector interval: {check_interval}s")
+                logger.info(
+                    f"- Results cleaner interval: {cleanup_interval}s, retention: {retention_period}s"
+                )
+
+                await wait_for_shutdown_signal()
                 logger.info("Monitoring services shutting down...")
-                raise
+
+    finally:
+        # A check still running past the collector's join timeout logs its
+        # IMAP session out on release, since the pool is closed by then
+        await runner.aclose()
 
 
 def start_agent():
@@ -130,10 +144,16 @@ def start_agent():
     )
     parser.add_argument(
         "--batch-size",
-        type=int,
+        type=_positive_int,
         default=1000,
         help="Maximum number of old results to delete in a single batch (default: 1000)",
     )
+    parser.add_argument(
+        "--vacuum-interval",
+        type=int,
+        default=0,
+        help="Run VACUUM after this many results have been deleted (default: 0 - never)",
+    )
     parser.add_argument(
         "--disable-cleaner",
         action="store_true",
@@ -162,6 +182,11 @@ def start_agent():
         logger.error(f"Database file not found: {db_path}")
         sys.exit(1)
 
+    import anyio
+    import uvloop
+
+    from ..adapters.repositories import SqliteStore
+
     try:
         logger.info(f"Initializing monitoring services with database: {args.db}")
         store = SqliteStore(db_path=db_path)
@@ -173,11 +198,12 @@ def start_agent():
                 cleanup_interval=args.cleanup_interval,
                 retention_period=args.retention_period,
                 batch_size=args.batch_size,
+                vacuum_interval=args.vacuum_interval,
                 disable_cleaner=args.disable_cleaner,
                 enable_telegram=args.enable_telegram,
             )
 
-        # anyio automatically handles SIGINT and SIGTERM
+        # SIGINT and SIGTERM make run_monitoring_services return normally
         anyio.run(main, backend_options={"loop_factory": uvloop.new_event_loop})
 
     except KeyboardInterrupt:
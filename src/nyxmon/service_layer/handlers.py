@@ -10,7 +10,7 @@ from ..domain import events, commands
 from ..domain.models import CheckResult, ResultStatus
 from ..adapters.runner import CheckRunner
 from .unit_of_work import UnitOfWork
-from ..domain.commands import AddCheckResult
+from ..domain.commands import AddCheckResults
 from .notification_suppression import notification_suppression_details
 
 
@@ -57,15 +57,19 @@ def execute_checks(
 ) -> None:
     """Execute all pending checks."""
     check_by_check_id = {check.check_id: check for check in cmd.checks}
+    check_results: list[CheckResult] = []
 
     def result_received(result):
         check = check_by_check_id[result.check_id]
         check.schedule_next_check()  # Schedule the next check after a result is received
-        check_result = CheckResult(check=check, result=result)
-        inner_cmd = AddCheckResult(check_result=check_result)
-        uow.add_command(inner_cmd)  # add command to the unit of work
+        check_results.append(CheckResult(check=check, result=result))
 
-    runner.run_all(cmd.checks, result_received)
+    try:
+        runner.run_all(cmd.checks, result_received)
+    finally:
+        # Store the whole batch with one write per table instead of one per result
+        if check_results:
+            uow.add_command(AddCheckResults(check_results=check_results))
 
 
 def add_check(cmd: commands.AddCheck, uow: UnitOfWork) -> None:
@@ -82,16 +86,7 @@ def add_check_result(
     """Add a check to the repository and trigger notifications if needed."""
     check_result = cmd.check_result
     check, result = check_result.check, check_result.result
-    if result.status in (
-        ResultStatus.ERROR,
-        ResultStatus.WARNING,
-    ):
-        suppression_details = notification_suppression_details(check)
-        if suppression_details:
-            result.data = {
-                **result.data,
-                "notification_suppressed": suppression_details,
-            }
+    _mark_notification_suppressed(check_result)
     with uow:
         uow.store.results.add(result)
         uow.store.checks.add(check)
@@ -107,6 +102,38 @@ def add_check_result(
         notifier.notify_check_failed(check, result)
 
 
+def add_check_results(
+    cmd: commands.AddCheckResults, uow: UnitOfWork, notifier: Notifier
+) -> None:
+    """Store a batch of check results with one write per table, then notify."""
+    for check_result in cmd.check_results:
+        _mark_notification_suppressed(check_result)
+    with uow:
+        uow.store.results.add_many([cr.result for cr in cmd.check_results])
+        uow.store.checks.add_many([cr.check for cr in cmd.check_results])
+        uow.commit()
+
+    threshold = _notify_consecutive_failure_threshold()
+    for check_result in cmd.check_results:
+        if _should_notify_check_result(check_result, uow, threshold):
+            notifier.notify_check_failed(check_result.check, check_result.result)
+
+
+def _mark_notification_suppressed(check_result: CheckResult) -> None:
+    """Record why a failing result won't notify, if the check suppresses it."""
+    result = check_result.result
+    if result.status in (
+        ResultStatus.ERROR,
+        ResultStatus.WARNING,
+    ):
+        suppression_details = notification_suppression_details(check_result.check)
+        if suppression_details:
+            result.data = {
+                **result.data,
+                "notification_suppressed": suppression_details,
+            }
+
+
 def start_collector(
     _cmd: commands.StartCollector,
     collector: CheckCollector,
@@ -172,6 +199,7 @@ COMMAND_HANDLERS: dict[type[commands.Command], Callable] = {
     commands.ExecuteChecks: execute_checks,
     commands.AddCheck: add_check,
     commands.AddCheckResult: add_check_result,
+    commands.AddCheckResults: add_check_results,
     commands.StartCollector: start_collector,
     commands.StopCollector: stop_collector,
     commands.StartCleaner: start_cleaner,
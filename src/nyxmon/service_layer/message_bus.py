@@ -1,4 +1,5 @@
 import logging
+from collections import deque
 from typing import Callable
 
 from ..domain import Event, Command
@@ -25,12 +26,12 @@ class MessageBus:
         self.uow = uow
         self.event_handlers = event_handlers
         self.command_handlers = command_handlers
-        self.queue: list[Message] = []
+        self.queue: deque[Message] = deque()
 
     def handle(self, message: Message):
         self.queue.append(message)
         while self.queue:
-            message = self.queue.pop(0)
+            message = self.queue.popleft()
             if isinstance(message, Event):
                 self.handle_event(message)
             elif isinstance(message, Command):
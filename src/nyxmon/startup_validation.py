@@ -25,20 +25,20 @@ async def validate_check_types(uow: UnitOfWork, runner: AsyncCheckRunner) -> Non
 
     Logs warnings if checks with unregistered types are found.
     """
-    checks = await uow.store.checks.list_async()
-
-    if not checks:
-        logger.info("No checks found in database - skipping check type validation")
-        return
-
     # Get registered check types from the runner's executor registry
     registered_types: Set[str] = set(runner.executor_registry.list_registered_types())
 
-    # Find checks with unregistered types
-    unknown_checks = [c for c in checks if c.check_type not in registered_types]
+    # Let the repository count the checks and find those with unregistered types
+    check_count, unknown_checks = await uow.store.checks.find_type_not_in_async(
+        registered_types
+    )
+
+    if not check_count:
+        logger.info("No checks found in database - skipping check type validation")
+        return
 
     if unknown_checks:
-        unknown_types = {c.check_type for c in unknown_checks}
+        unknown_types = {check_type for _, _, check_type in unknown_checks}
         logger.warning(
             f"Found {len(unknown_checks)} check(s) with unregistered types: {unknown_types}"
         )
@@ -47,10 +47,9 @@ async def validate_check_types(uow: UnitOfWork, runner: AsyncCheckRunner) -> Non
         )
 
         # Log details for each problematic check
-        for check in unknown_checks:
+        for check_id, name, check_type in unknown_checks:
             logger.warning(
-                f"  - Check #{check.check_id} '{check.name}': "
-                f"type='{check.check_type}' (unregistered)"
+                f"  - Check #{check_id} '{name}': type='{check_type}' (unregistered)"
             )
 
         logger.warning(
@@ -59,5 +58,5 @@ async def validate_check_types(uow: UnitOfWork, runner: AsyncCheckRunner) -> Non
         )
     else:
         logger.info(
-            f"Validated {len(checks)} check(s) - all types registered: {registered_types}"
+            f"Validated {check_count} check(s) - all types registered: {registered_types}"
         )
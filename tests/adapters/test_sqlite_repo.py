@@ -2,7 +2,9 @@
 
 import pytest
 import json
+import sqlite3
 import tempfile
+import uuid
 from pathlib import Path
 
 from nyxmon.adapters.repositories.sqlite_repo import SqliteCheckRepository
@@ -21,9 +23,22 @@ def temp_db():
 
 
 @pytest.fixture
-def check_repo(temp_db):
-    """Create a check repository with a temporary database."""
-    return SqliteCheckRepository(temp_db)
+def memory_db():
+    """Create a private shared-cache in-memory database URI.
+
+    The repository opens a connection per call, so one connection is held
+    open here to keep the database alive for the whole test.
+    """
+    uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)
+    yield uri
+    keeper.close()
+
+
+@pytest.fixture
+def check_repo(memory_db):
+    """Create a check repository with an in-memory database."""
+    return SqliteCheckRepository(memory_db)
 
 
 class TestCheckDataRoundTrip:
@@ -295,7 +310,7 @@ class TestCheckDataMigration:
         import aiosqlite
 
         # Insert a check with JSON data directly
-        async with aiosqlite.connect(check_repo._db_path) as db:
+        async with aiosqlite.connect(check_repo._db_path, uri=True) as db:
             await check_repo._ensure_schema(db)
 
             dns_config = {
@@ -339,7 +354,7 @@ class TestCheckDataMigration:
         import aiosqlite
 
         # Insert a check with NULL data
-        async with aiosqlite.connect(check_repo._db_path) as db:
+        async with aiosqlite.connect(check_repo._db_path, uri=True) as db:
             await check_repo._ensure_schema(db)
 
             await db.execute(
@@ -370,3 +385,66 @@ class TestCheckDataMigration:
         # Should return empty dict for NULL data
         assert len(checks) == 1
         assert checks[0].data == {}
+
+    @pytest.mark.anyio
+    async def test_list_async_maps_every_column(self, check_repo):
+        """Test that list_async() restores every field, including booleans."""
+        assert await check_repo.list_async() == []
+
+        check = Check(
+            check_id=7,
+            service_id=3,
+            name="Disabled Check",
+            check_type=CheckType.HTTP,
+            url="https://example.com",
+            check_interval=60,
+            status=CheckStatus.PROCESSING,
+            next_check_time=1234,
+            processing_started_at=1200,
+            disabled=True,
+            data={"nested": {"ok": True, "values": [1, 2.5, None]}},
+        )
+        await check_repo._add_async(check)
+
+        [listed] = await check_repo.list_async()
+
+        assert listed.disabled is True
+        for field in (
+            "check_id",
+            "service_id",
+            "name",
+            "check_type",
+            "url",
+            "check_interval",
+            "status",
+            "next_check_time",
+            "processing_started_at",
+            "data",
+        ):
+            assert getattr(listed, field) == getattr(check, field)
+
+    @pytest.mark.anyio
+    async def test_find_type_not_in_async_filters_in_sql(self, check_repo):
+        """Test that only checks with other types come back, along with the total."""
+        assert await check_repo.find_type_not_in_async({"http"}) == (0, [])
+
+        for check_id, check_type in [(1, "http"), (2, "legacy"), (3, "dns")]:
+            await check_repo._add_async(
+                Check(
+                    check_id=check_id,
+                    service_id=1,
+                    name=f"Check {check_id}",
+                    check_type=check_type,
+                    url="example.com",
+                    data={},
+                )
+            )
+
+        assert await check_repo.find_type_not_in_async({"http", "dns"}) == (
+            3,
+            [(2, "Check 2", "legacy")],
+        )
+        assert await check_repo.find_type_not_in_async({"http", "dns", "legacy"}) == (
+            3,
+            [],
+        )
@@ -58,6 +58,34 @@ class TestDashboardView:
         assert len(results) == 1
         assert results[0].status == ResultStatus.OK
 
+    def test_dashboard_annotates_rendered_checks_with_recent_results(
+        self, client, django_assert_max_num_queries
+    ):
+        """Recent results for every check are loaded without a query per check."""
+        service = Service.objects.create(name="Test Service")
+        checks = [
+            HealthCheck.objects.create(
+                service=service, check_type="http", url=f"https://{i}.example.com"
+            )
+            for i in range(3)
+        ]
+        for check in checks:
+            for _ in range(7):
+                Result.objects.create(
+                    health_check=check, status=ResultStatus.OK, data={}
+                )
+        newest = Result.objects.filter(health_check=checks[0]).order_by("-id").first()
+
+        url = reverse("nyxboard:dashboard")
+        # services, checks and results, plus the session writes
+        with django_assert_max_num_queries(7):
+            response = client.get(url)
+
+        rendered = response.context["services"][0].healthcheck_set.all()
+        assert [len(check.recent_results) for check in rendered] == [5, 5, 5]
+        assert rendered[0].last_result == newest
+        assert str(checks[0].id) in response.context["check_results"]
+
 
 @pytest.mark.django_db
 class TestServiceViews:
@@ -147,3 +175,35 @@ class TestHealthCheckViews:
         assert response.context["health_check"] == health_check
         assert "results" in response.context
         assert len(response.context["results"]) == 2
+
+    def test_healthcheck_list_view_skips_check_config(self, client):
+        """The list renders service names without loading each check's config."""
+        service = Service.objects.create(name="List Service")
+        HealthCheck.objects.create(
+            service=service,
+            name="Listed check",
+            check_type="http",
+            url="https://example.com",
+            data={"expected_status": 200},
+        )
+
+        response = client.get(reverse("nyxboard:healthcheck_list"))
+
+        assert response.status_code == 200
+        assert b"List Service" in response.content
+        (check,) = response.context["health_checks"]
+        assert "data" in check.get_deferred_fields()
+
+    def test_fetch_recent_results_is_memoized(self, django_assert_num_queries):
+        """Repeated reads of a check's recent results share one query."""
+        service = Service.objects.create(name="Memo Service")
+        health_check = HealthCheck.objects.create(
+            service=service, check_type="http", url="https://example.com"
+        )
+        for status in [ResultStatus.ERROR, ResultStatus.OK]:
+            Result.objects.create(health_check=health_check, status=status, data={})
+
+        with django_assert_num_queries(1):
+            results = health_check.fetch_recent_results()
+            assert health_check.fetch_recent_results() is results
+            assert health_check.get_status() == StatusChoices.RECOVERING
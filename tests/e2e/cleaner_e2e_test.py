@@ -143,48 +143,28 @@ async def test_cleaner_integration(populated_db):
 
 @pytest.mark.anyio
 async def test_cleaner_with_batch_size(populated_db):
-    """Test that the cleaner respects batch size"""
+    """Test that the cleaner works through all old records in small batches"""
     # Set up the store with the populated database
     store = SqliteStore(db_path=populated_db)
 
-    # Create a cleaner with a very short interval and small batch size
+    # Create a cleaner with a long interval and small batch size
     cleaner = AsyncResultsCleaner(
-        interval=0.5,  # Run every 0.5 seconds
+        interval=60,  # Only the first run happens during the test
         retention_period=24 * 60 * 60,  # 24 hours retention
-        batch_size=2,  # Delete only 2 records per run
+        batch_size=2,  # Delete only 2 records per batch
     )
 
     # Bootstrap the system
     bus = bootstrap(store=store, cleaner=cleaner)
 
-    # Run the cleaner for a short time (enough for 1 run)
+    # Run the cleaner long enough for five batches with pauses in between
     async with running_cleaner(bus):
-        # Wait a bit for the cleaner to run
-        await anyio.sleep(0.7)
+        await anyio.sleep(0.8)
 
-    # Verify that only a batch of old records was deleted
+    # Verify that a single run deleted all 10 old records
     conn = sqlite3.connect(populated_db)
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) FROM check_result")
-    count_after_one_run = cursor.fetchone()[0]
-
-    # Should have deleted 4 records (2 each from two runs) from the 10 old records
-    assert count_after_one_run == 11
-
-    conn.close()
-
-    # Run again to delete more
-    async with running_cleaner(bus):
-        # Wait a bit for the cleaner to run
-        await anyio.sleep(0.7)
-
-    # Verify that another batch was deleted
-    conn = sqlite3.connect(populated_db)
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM check_result")
-    count_after_two_runs = cursor.fetchone()[0]
-
-    # Should have deleted more records, bringing total to 8 deleted
-    assert count_after_two_runs == 7
+    assert cursor.fetchone()[0] == 5
 
     conn.close()
@@ -0,0 +1,32 @@
+import logging
+import os
+import signal
+
+import anyio
+import pytest
+
+from nyxmon.adapters.repositories import SqliteStore
+from nyxmon.entrypoints.cli import run_monitoring_services
+
+
+@pytest.mark.anyio
+async def test_sigterm_shuts_monitoring_services_down(tmp_path, caplog):
+    store = SqliteStore(db_path=tmp_path / "checks.db")
+
+    async def send_sigterm():
+        # Only signal once the agent has installed its handler, otherwise the
+        # default action would terminate the test run
+        while signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+            await anyio.sleep(0.05)
+        await anyio.sleep(0.2)  # let the collector run at least once
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    caplog.set_level(logging.INFO)
+    with anyio.fail_after(10):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(send_sigterm)
+            await run_monitoring_services(store, 0.1, disable_cleaner=True)
+
+    # The agent returned normally after stopping the collector thread
+    assert "Monitoring services shutting down..." in caplog.messages
+    assert not any("didn't exit cleanly" in m for m in caplog.messages)
@@ -26,6 +26,12 @@ class TestAsyncResultsCleaner:
         assert cleaner.retention_period == 172800
         assert cleaner.batch_size == 500
 
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_init_rejects_non_positive_batch_size(self, batch_size):
+        """A non-positive LIMIT never yields a short batch, so refuse it"""
+        with pytest.raises(ValueError):
+            AsyncResultsCleaner(batch_size=batch_size)
+
     def test_store_setter(self):
         """Test setting the store"""
         cleaner = AsyncResultsCleaner()
@@ -160,3 +166,57 @@ class TestAsyncResultsCleaner:
 
                 # Verify exception was logged
                 mock_logger.exception.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_delete_old_results_repeats_full_batches(self):
+        """Full batches are followed by another batch until one comes back short"""
+        cleaner = AsyncResultsCleaner(batch_size=2)
+        mock_results_repo = AsyncMock()
+        mock_results_repo.delete_old_results_async.side_effect = [2, 2, 1]
+        cleaner._store = MagicMock(results=mock_results_repo)
+        cleaner._running = True
+
+        with patch("nyxmon.adapters.cleaner.anyio.sleep", new=AsyncMock()) as sleep:
+            deleted = await cleaner._delete_old_results()
+
+        assert deleted == 5
+        assert mock_results_repo.delete_old_results_async.await_count == 3
+        assert sleep.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_delete_old_results_stops_when_nothing_was_deleted(self):
+        cleaner = AsyncResultsCleaner(batch_size=2)
+        mock_results_repo = AsyncMock()
+        mock_results_repo.delete_old_results_async.side_effect = [2, 0]
+        cleaner._store = MagicMock(results=mock_results_repo)
+        cleaner._running = True
+
+        with patch("nyxmon.adapters.cleaner.anyio.sleep", new=AsyncMock()):
+            deleted = await cleaner._delete_old_results()
+
+        assert deleted == 2
+        assert mock_results_repo.delete_old_results_async.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_vacuum_runs_after_interval_deletions(self):
+        """VACUUM only runs once enough results have been deleted"""
+        cleaner = AsyncResultsCleaner(vacuum_interval=10)
+        mock_results_repo = AsyncMock()
+        cleaner._store = MagicMock(results=mock_results_repo)
+
+        await cleaner._maybe_vacuum(6)
+        mock_results_repo.vacuum_async.assert_not_awaited()
+
+        await cleaner._maybe_vacuum(4)
+        mock_results_repo.vacuum_async.assert_awaited_once()
+        assert cleaner._deleted_since_vacuum == 0
+
+    @pytest.mark.anyio
+    async def test_vacuum_disabled_by_default(self):
+        cleaner = AsyncResultsCleaner()
+        mock_results_repo = AsyncMock()
+        cleaner._store = MagicMock(results=mock_results_repo)
+
+        await cleaner._maybe_vacuum(10_000)
+
+        mock_results_repo.vacuum_async.assert_not_awaited()
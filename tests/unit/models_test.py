@@ -25,3 +25,14 @@ def test_check_result_passed(status, expected):
     assert check_result.passed == expected, (
         f"Expected {expected}, but got {check_result.passed}"
     )
+
+
+def test_events_are_allocated_on_first_use():
+    # Given a fresh check
+    check = Check(check_id=1, service_id=1, check_type="http", url="http://.", data={})
+
+    # When an event is recorded, the same list is returned on every access
+    check.events.append("event")
+
+    # Then the event is kept
+    assert check.events == ["event"]
@@ -103,6 +103,33 @@ def populated_db(test_db_path):
 
 
 class TestSqliteResultRepository:
+    @pytest.mark.anyio
+    async def test_add_many_async_writes_all_results(self, sqlite_result_repo):
+        results = create_test_results(num_recent=3, num_old=0, num_very_old=0)
+
+        await sqlite_result_repo._add_many_async(results["all"])
+
+        conn = sqlite3.connect(sqlite_result_repo._db_path)
+        ids = [row[0] for row in conn.execute("SELECT id FROM check_result")]
+        conn.close()
+        assert sorted(ids) == [1, 2, 3]
+        assert sqlite_result_repo.seen == set(results["all"])
+
+    @pytest.mark.anyio
+    async def test_add_many_async_skips_rejected_rows(self, sqlite_result_repo):
+        first, duplicate, last = create_test_results(
+            num_recent=3, num_old=0, num_very_old=0
+        )["all"]
+        duplicate.result_id = first.result_id  # violates the primary key
+
+        await sqlite_result_repo._add_many_async([first, duplicate, last])
+
+        conn = sqlite3.connect(sqlite_result_repo._db_path)
+        ids = [row[0] for row in conn.execute("SELECT id FROM check_result")]
+        conn.close()
+        assert sorted(ids) == [first.result_id, last.result_id]
+        assert sqlite_result_repo.seen == {first, last}
+
     @pytest.mark.anyio
     async def test_delete_old_results_async(self, populated_db):
         """Test that delete_old_results_async removes old results but keeps recent ones"""
@@ -173,6 +200,19 @@ class TestSqliteResultRepository:
 
         conn.close()
 
+    @pytest.mark.anyio
+    async def test_vacuum_async_keeps_remaining_results(self, populated_db):
+        """Test that vacuum_async runs after a delete without losing rows"""
+        repo = SqliteResultRepository(db_path=populated_db)
+        await repo.delete_old_results_async(retention_seconds=24 * 60 * 60)
+
+        await repo.vacuum_async()
+
+        conn = sqlite3.connect(populated_db)
+        count = conn.execute("SELECT COUNT(*) FROM check_result").fetchone()[0]
+        conn.close()
+        assert count == 1
+
     @pytest.mark.anyio
     async def test_delete_old_results_sync_wrapper(self, populated_db):
         """Test that the sync wrapper for delete_old_results works"""
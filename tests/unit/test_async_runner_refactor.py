@@ -335,3 +335,17 @@ class TestAsyncRunnerExecutorCleanup:
 
                 # Verify cleanup still happened
                 mock_client_instance.aclose.assert_called_once()
+
+
+class TestAsyncRunnerDnsResolverReuse:
+    """The DNS resolver outlives the executors rebuilt for each batch."""
+
+    def test_dns_executors_share_runner_resolver(self):
+        runner = AsyncCheckRunner(MagicMock())
+        preregistered = runner.executor_registry.get_executor(CheckType.DNS)
+
+        runner._register_executors(None)
+        rebuilt = runner.executor_registry.get_executor(CheckType.DNS)
+
+        assert rebuilt is not preregistered
+        assert rebuilt._resolver is preregistered._resolver is runner._dns_resolver
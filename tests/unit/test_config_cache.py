@@ -0,0 +1,61 @@
+"""Unit tests for the shared check config cache."""
+
+from collections import OrderedDict
+
+import pytest
+
+from nyxmon.adapters.runner.executors import config_cache
+from nyxmon.adapters.runner.executors.config_cache import load_config
+from nyxmon.domain.dns_config import DnsCheckConfig
+from nyxmon.domain.http_config import HttpCheckConfig
+from nyxmon.domain.tcp_config import TcpCheckConfig
+
+
+def test_load_config_reuses_parse_for_equal_data() -> None:
+    first = load_config(DnsCheckConfig, {"expected_ips": ["192.0.2.1"], "timeout": 2.0})
+    second = load_config(
+        DnsCheckConfig, {"timeout": 2.0, "expected_ips": ["192.0.2.1"]}
+    )
+
+    assert first is second
+    assert first.expected_ips == ["192.0.2.1"]
+
+
+def test_load_config_keys_on_content_not_identity() -> None:
+    data = {"expected_ips": ["192.0.2.1"]}
+    first = load_config(DnsCheckConfig, data)
+    data["expected_ips"].append("192.0.2.2")
+
+    second = load_config(DnsCheckConfig, data)
+
+    assert second is not first
+    assert second.expected_ips == ["192.0.2.1", "192.0.2.2"]
+
+
+def test_load_config_separates_config_types() -> None:
+    data = {"port": 443, "timeout": 5.0}
+
+    assert isinstance(load_config(TcpCheckConfig, data), TcpCheckConfig)
+    assert isinstance(load_config(HttpCheckConfig, data), HttpCheckConfig)
+
+
+def test_load_config_still_rejects_invalid_data() -> None:
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid query_type"):
+            load_config(
+                DnsCheckConfig,
+                {"expected_ips": ["192.0.2.1"], "query_type": "BOGUS"},
+            )
+
+
+def test_load_config_evicts_least_recently_used(monkeypatch) -> None:
+    monkeypatch.setattr(config_cache, "MAX_CACHED_CONFIGS", 2)
+    monkeypatch.setattr(config_cache, "_cache", OrderedDict())
+    hot = load_config(TcpCheckConfig, {"port": 1})
+    load_config(TcpCheckConfig, {"port": 2})
+    assert load_config(TcpCheckConfig, {"port": 1}) is hot
+
+    load_config(TcpCheckConfig, {"port": 3})
+
+    assert load_config(TcpCheckConfig, {"port": 1}) is hot
+    assert len(config_cache._cache) == 2
@@ -134,3 +134,10 @@ class TestDnsCheckConfig:
         config.timeout = -1
         with pytest.raises(ValueError, match="Timeout must be positive"):
             config.validate()
+
+    def test_expected_ips_set_is_frozen_once(self):
+        """Should expose expected_ips as a frozenset without serializing it."""
+        config = DnsCheckConfig.from_dict({"expected_ips": ["10.0.0.1", "10.0.0.2"]})
+
+        assert config.expected_ips_set == frozenset({"10.0.0.1", "10.0.0.2"})
+        assert "expected_ips_set" not in config.to_dict()
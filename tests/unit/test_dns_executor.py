@@ -15,6 +15,7 @@ from nyxmon.adapters.runner.executors.dns_executor import (
     DnspythonResolver,
 )
 from nyxmon.domain import Check, CheckType, ResultStatus
+from nyxmon.domain.dns_config import DnsCheckConfig
 
 
 def _build_check(**data: Any) -> Check:
@@ -235,3 +236,65 @@ class TestDnspythonResolver:
 
         assert result.status == ResultStatus.OK
         assert captured_kwargs["source"] == "192.168.178.50"
+
+    @pytest.mark.anyio
+    async def test_resolver_is_reused_for_same_server_and_timeout(
+        self, monkeypatch
+    ) -> None:
+        created: list[object] = []
+
+        class FakeResolver:
+            def __init__(self):
+                self.nameservers: list[str] = []
+                self.timeout = 0
+                self.lifetime = 0
+                created.append(self)
+
+        monkeypatch.setattr("dns.asyncresolver.Resolver", FakeResolver)
+
+        resolver = DnspythonResolver()
+        config = DnsCheckConfig(expected_ips=["1.1.1.1"], dns_server="9.9.9.9")
+        other = DnsCheckConfig(expected_ips=["1.1.1.1"], dns_server="8.8.8.8")
+
+        first = resolver._get_resolver(config)
+        assert resolver._get_resolver(config) is first
+        assert resolver._get_resolver(other) is not first
+        assert len(created) == 2
+        assert first.nameservers == ["9.9.9.9"]
+
+    @pytest.mark.anyio
+    async def test_nxdomain_is_negative_cached(self, monkeypatch) -> None:
+        calls: list[str] = []
+
+        class FailingResolver:
+            def __init__(self):
+                self.nameservers: list[str] = []
+                self.timeout = 0
+                self.lifetime = 0
+
+            async def resolve(self, domain, rdtype, **kwargs):
+                calls.append(domain)
+                raise dns.resolver.NXDOMAIN()
+
+        monkeypatch.setattr("dns.asyncresolver.Resolver", FailingResolver)
+
+        resolver = DnspythonResolver(negative_ttl=60)
+        config = DnsCheckConfig(expected_ips=["192.0.2.1"])
+
+        errors = []
+        for _ in range(3):
+            with pytest.raises(dns.resolver.NXDOMAIN) as excinfo:
+                await resolver.query("missing.example", config)
+            errors.append(excinfo.value)
+
+        assert calls == ["missing.example"]
+        # Cache hits raise fresh copies instead of re-raising a shared instance
+        assert errors[1] is not errors[2]
+        assert str(errors[1]) == str(errors[0])
+
+        # A different per-check timeout is a separate cache entry
+        slower = DnsCheckConfig(expected_ips=["192.0.2.1"], timeout=30.0)
+        with pytest.raises(dns.resolver.NXDOMAIN):
+            await resolver.query("missing.example", slower)
+
+        assert calls == ["missing.example", "missing.example"]
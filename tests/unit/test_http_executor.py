@@ -100,7 +100,7 @@ async def test_exact_redirect_contract_retries_transient_status(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(
-        "nyxmon.adapters.runner.executors.http_executor.anyio.sleep",
+        "nyxmon.adapters.runner.executors.retry.anyio.sleep",
         _fast_sleep,
     )
     location = "https://fabian-heis.de/probe/path?query=preserved"
@@ -163,7 +163,7 @@ async def test_502_then_200_succeeds_when_retries_allow(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(
-        "nyxmon.adapters.runner.executors.http_executor.anyio.sleep",
+        "nyxmon.adapters.runner.executors.retry.anyio.sleep",
         _fast_sleep,
     )
     client = StubClient([StubResponse(502), StubResponse(200)])
@@ -184,7 +184,7 @@ async def test_exhausted_502_retries_returns_error_with_attempts(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(
-        "nyxmon.adapters.runner.executors.http_executor.anyio.sleep",
+        "nyxmon.adapters.runner.executors.retry.anyio.sleep",
         _fast_sleep,
     )
     client = StubClient([StubResponse(502), StubResponse(502)])
@@ -234,7 +234,7 @@ async def test_non_2xx_status_is_error(status_code: int) -> None:
 @pytest.mark.anyio
 async def test_timeout_retries_when_configured(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        "nyxmon.adapters.runner.executors.http_executor.anyio.sleep",
+        "nyxmon.adapters.runner.executors.retry.anyio.sleep",
         _fast_sleep,
     )
     client = StubClient(
@@ -260,7 +260,7 @@ async def test_request_error_retries_when_configured(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(
-        "nyxmon.adapters.runner.executors.http_executor.anyio.sleep",
+        "nyxmon.adapters.runner.executors.retry.anyio.sleep",
         _fast_sleep,
     )
     request = httpx.Request("GET", "https://example.test/health")
@@ -6,10 +6,13 @@ from typing import Any
 import anyio
 from nyxmon.adapters.runner.executors.imap_executor import (
     ImapCheckExecutor,
+    ImapLibSession,
     ImapMessage,
+    ImapSessionPool,
     ImapTransientError,
 )
 from nyxmon.domain import Check, ResultStatus
+from nyxmon.domain.imap_config import ImapCheckConfig
 
 
 def _build_check(**data: Any) -> Check:
@@ -28,6 +31,7 @@ def _build_check(**data: Any) -> Check:
         name=data.get("name", "IMAP Test"),
         check_type="imap",
         url=data.get("url", "imap.example.com"),
+        check_interval=data.get("check_interval", 300),
         data=default_config,
     )
 
@@ -83,9 +87,17 @@ class StubSession:
             if msg.internaldate >= cutoff and subject in msg.subject
         ]
 
+    async def search_latest(
+        self, subject: str, max_age_minutes: int
+    ) -> list[ImapMessage]:
+        return await self.search_recent(subject, max_age_minutes)
+
     async def delete_messages(self, ids: list[str]) -> None:
         self.deleted.extend(ids)
 
+    async def ping(self) -> bool:
+        return True
+
 
 def test_successful_search_and_delete(monkeypatch) -> None:
     """Should return OK when a recent message is found and delete it."""
@@ -119,6 +131,128 @@ def test_successful_search_and_delete(monkeypatch) -> None:
     assert session.deleted == ["1", "2"]
 
 
+def test_pooled_session_is_reused_across_checks() -> None:
+    """Should log in once and reuse the session for the next check."""
+    now = datetime.now(timezone.utc)
+    sessions: list[StubSession] = []
+
+    def factory(*_: Any) -> StubSession:
+        session = StubSession(
+            messages=[ImapMessage(uid="1", subject="[nyxmon] a", internaldate=now)]
+        )
+        sessions.append(session)
+        return session
+
+    pool = ImapSessionPool()
+    executor = ImapCheckExecutor(session_factory=factory, pool=pool)
+    check = _build_check(check_interval=60)
+
+    first = anyio.run(executor.execute, check)
+    second = anyio.run(executor.execute, check)
+
+    assert first.status == ResultStatus.OK
+    assert second.status == ResultStatus.OK
+    assert len(sessions) == 1
+    assert sessions[0].enter_count == 1
+    assert sessions[0].search_calls == 2
+
+
+def test_session_is_not_pooled_when_interval_exceeds_idle_timeout() -> None:
+    """A session would expire before the next run, so log out right away."""
+    now = datetime.now(timezone.utc)
+    sessions: list[StubSession] = []
+
+    def factory(*_: Any) -> StubSession:
+        session = StubSession(
+            messages=[ImapMessage(uid="1", subject="[nyxmon] a", internaldate=now)]
+        )
+        sessions.append(session)
+        return session
+
+    pool = ImapSessionPool(idle_timeout=300.0)
+    executor = ImapCheckExecutor(session_factory=factory, pool=pool)
+    check = _build_check(check_interval=300)
+
+    anyio.run(executor.execute, check)
+    anyio.run(executor.execute, check)
+
+    assert len(sessions) == 2
+    assert pool._idle == {}
+
+
+def test_pool_reaps_expired_sessions_for_other_keys() -> None:
+    """Idle sessions past the timeout are logged out on the next pool access."""
+    closed: list[str] = []
+
+    class ClosingSession(StubSession):
+        def __init__(self, name: str) -> None:
+            super().__init__()
+            self.name = name
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+            closed.append(self.name)
+
+    pool = ImapSessionPool(idle_timeout=0.0)
+    stale_key = ("old.example.com", 993, "ssl", "user", "secret", "INBOX", 30.0)
+    other_key = ("imap.example.com", 993, "ssl", "user", "secret", "INBOX", 30.0)
+
+    async def main() -> None:
+        await pool.release(stale_key, ClosingSession("stale"))
+        await anyio.sleep(0.01)
+        assert await pool.acquire(other_key) is None
+
+    anyio.run(main)
+
+    assert closed == ["stale"]
+    assert pool._idle == {}
+
+
+def test_closed_pool_logs_out_released_sessions() -> None:
+    """A check finishing after shutdown must not park its session again."""
+    closed: list[int] = []
+
+    class ClosingSession(StubSession):
+        async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+            closed.append(1)
+
+    pool = ImapSessionPool()
+    key = ("imap.example.com", 993, "ssl", "user", "secret", "INBOX", 30.0)
+
+    async def main() -> None:
+        await pool.aclose()
+        await pool.release(key, ClosingSession())
+        assert await pool.acquire(key) is None
+
+    anyio.run(main)
+
+    assert closed == [1]
+    assert pool._idle == {}
+
+
+def test_runner_aclose_logs_out_pooled_sessions() -> None:
+    """Shutting the runner down closes the sessions it kept for reuse."""
+    from unittest.mock import Mock
+
+    from nyxmon.adapters.runner import AsyncCheckRunner
+
+    closed: list[int] = []
+
+    class ClosingSession(StubSession):
+        async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+            closed.append(1)
+
+    runner = AsyncCheckRunner(Mock())
+    key = ("imap.example.com", 993, "ssl", "user", "secret", "INBOX", 30.0)
+
+    async def main() -> None:
+        await runner._imap_pool.release(key, ClosingSession())
+        await runner.aclose()
+
+    anyio.run(main)
+
+    assert closed == [1]
+
+
 def test_no_recent_messages_returns_error() -> None:
     """Should return ERROR after retrying when no messages are recent enough."""
     old = datetime.now(timezone.utc) - timedelta(minutes=60)
@@ -268,3 +402,120 @@ def test_invalid_configuration_short_circuits() -> None:
     assert session.enter_count == 0
     assert result.status == ResultStatus.ERROR
     assert "configuration" in result.data["error_type"]
+
+
+class FakeImapConnection:
+    """Minimal imaplib connection double recording issued commands."""
+
+    def __init__(
+        self,
+        search_ids: bytes = b"",
+        fetch_data: list | None = None,
+        capabilities: tuple[str, ...] = ("IMAP4REV1",),
+    ) -> None:
+        self.search_ids = search_ids
+        self.fetch_data = fetch_data or []
+        self.capabilities = capabilities
+        self.calls: list[tuple] = []
+
+    def expunge(self):
+        self.calls.append(("expunge",))
+        return "OK", [None]
+
+    def uid(self, command, *args):
+        self.calls.append((command, *args))
+        if command == "SEARCH":
+            return "OK", [self.search_ids]
+        if command == "FETCH":
+            return "OK", self.fetch_data
+        return "OK", [None]
+
+
+def test_imaplib_session_fetches_internaldates_in_one_round_trip() -> None:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    old = now - timedelta(hours=2)
+    fmt = "%d-%b-%Y %H:%M:%S +0000"
+    conn = FakeImapConnection(
+        b"11 12",
+        [
+            f'1 (UID 11 INTERNALDATE "{old.strftime(fmt)}")'.encode(),
+            f'2 (UID 12 INTERNALDATE "{now.strftime(fmt)}")'.encode(),
+        ],
+    )
+    config = ImapCheckConfig.from_dict(
+        {
+            "host": "imap.example.com",
+            "username": "user",
+            "password": "secret",
+            "search_subject": "[nyxmon]",
+        }
+    )
+    session = ImapLibSession("imap.example.com", config)
+    session._conn = conn  # type: ignore[assignment]
+
+    messages = anyio.run(session.search_recent, "[nyxmon]", 30)
+
+    assert [m.uid for m in messages] == ["12"]
+    assert messages[0].internaldate == now
+    search_call = conn.calls[0]
+    assert search_call[0] == "SEARCH"
+    assert "SINCE" in search_call
+    fetch_calls = [call for call in conn.calls if call[0] == "FETCH"]
+    assert fetch_calls == [("FETCH", b"11,12", "(UID INTERNALDATE)")]
+
+
+def test_imaplib_session_latest_only_fetches_newest_uid() -> None:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    fmt = "%d-%b-%Y %H:%M:%S +0000"
+    conn = FakeImapConnection(
+        b"11 12", [f'2 (UID 12 INTERNALDATE "{now.strftime(fmt)}")'.encode()]
+    )
+    config = ImapCheckConfig.from_dict(
+        {
+            "host": "imap.example.com",
+            "username": "user",
+            "password": "secret",
+            "search_subject": "[nyxmon]",
+        }
+    )
+    session = ImapLibSession("imap.example.com", config)
+    session._conn = conn  # type: ignore[assignment]
+
+    messages = anyio.run(session.search_latest, "[nyxmon]", 30)
+
+    assert [m.uid for m in messages] == ["12"]
+    fetch_calls = [call for call in conn.calls if call[0] == "FETCH"]
+    assert fetch_calls == [("FETCH", b"12", "(UID INTERNALDATE)")]
+
+
+def _session_with(conn: FakeImapConnection) -> ImapLibSession:
+    config = ImapCheckConfig.from_dict(
+        {
+            "host": "imap.example.com",
+            "username": "user",
+            "password": "secret",
+            "search_subject": "[nyxmon]",
+        }
+    )
+    session = ImapLibSession("imap.example.com", config)
+    session._conn = conn  # type: ignore[assignment]
+    return session
+
+
+def test_imaplib_session_uses_uid_expunge_with_uidplus() -> None:
+    conn = FakeImapConnection(capabilities=("IMAP4REV1", "UIDPLUS"))
+
+    anyio.run(_session_with(conn).delete_messages, ["11", "12"])
+
+    assert conn.calls == [
+        ("STORE", "11,12", "+FLAGS", "\\Deleted"),
+        ("EXPUNGE", "11,12"),
+    ]
+
+
+def test_imaplib_session_falls_back_to_expunge_without_uidplus() -> None:
+    conn = FakeImapConnection()
+
+    anyio.run(_session_with(conn).delete_messages, ["11"])
+
+    assert conn.calls == [("STORE", "11", "+FLAGS", "\\Deleted"), ("expunge",)]
@@ -1,8 +1,10 @@
 """Unit tests for JsonMetricsCheckConfig."""
 
+import operator
+
 import pytest
 
-from nyxmon.domain.json_metrics_config import JsonMetricsCheckConfig
+from nyxmon.domain.json_metrics_config import JsonMetricsCheckConfig, compile_path
 
 
 class TestJsonMetricsCheckConfig:
@@ -82,6 +84,31 @@ class TestJsonMetricsCheckConfig:
         assert restored.retries == 0
         assert restored.retry_delay == 0.5
 
+    def test_check_binds_comparator_from_op(self) -> None:
+        check = JsonMetricsCheckConfig.Check(
+            path="$.a", op=">=", value=3, severity="warning"
+        )
+
+        assert check.comparator is operator.ge
+        assert check.comparator(3, check.value)
+
+    def test_check_with_unknown_op_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="Invalid operator"):
+            JsonMetricsCheckConfig.Check(
+                path="$.a", op="contains", value=3, severity="warning"
+            )
+
+    def test_check_compiles_path_into_parts(self) -> None:
+        check = JsonMetricsCheckConfig.Check(
+            path="$.disks[0].used", op="<", value=90, severity="warning"
+        )
+
+        assert check.parts == (("disks", None), ("0", 0), ("used", None))
+
+    def test_root_array_paths_compile_without_the_dollar(self) -> None:
+        assert compile_path("$[0].x") == (("0", 0), ("x", None))
+        assert compile_path("$[1]") == (("1", 1),)
+
     def test_missing_required_fields(self) -> None:
         with pytest.raises(ValueError):
             JsonMetricsCheckConfig.from_dict({})
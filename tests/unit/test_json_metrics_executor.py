@@ -1,11 +1,15 @@
 """Unit tests for the JSON metrics executor."""
 
+import json
+from contextlib import asynccontextmanager
+
 import anyio
 import httpx
 
 from nyxmon.adapters.runner.executors.json_metrics_executor import (
     JsonMetricsExecutor,
     JsonMetricsError,
+    _json_loads,
 )
 from nyxmon.domain import Check, ResultStatus
 
@@ -41,29 +45,40 @@ class StubClient:
         self.response = response
         self.calls = 0
 
-    async def get(self, url, auth=None, timeout=None):
+    @asynccontextmanager
+    async def stream(self, method, url, auth=None, timeout=None):
         self.calls += 1
         if isinstance(self.response, Exception):
             raise self.response
-        return self.response
+        yield self.response
 
     async def aclose(self):
         return None
 
 
 class StubResponse:
-    def __init__(self, status_code: int, json_body):
+    def __init__(self, status_code: int, json_body, headers=None, chunk_size=16):
         self.status_code = status_code
         self._json_body = json_body
+        self.headers = headers or {}
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
 
     def raise_for_status(self):
         if self.status_code >= 400:
             raise JsonMetricsError(f"HTTP {self.status_code}")
 
-    def json(self):
+    @property
+    def content(self) -> bytes:
         if isinstance(self._json_body, Exception):
-            raise self._json_body
-        return self._json_body
+            return b"{not json"
+        return json.dumps(self._json_body).encode()
+
+    async def aiter_bytes(self):
+        content = self.content
+        for i in range(0, len(content), self.chunk_size):
+            self.chunks_read += 1
+            yield content[i : i + self.chunk_size]
 
 
 def test_successful_thresholds_pass() -> None:
@@ -186,6 +201,52 @@ def test_json_parse_error() -> None:
     assert result.data["error_type"] == "json_error"
 
 
+def test_body_decoding_matches_stdlib_json() -> None:
+    """orjson's NaN and 64-bit integer limits must not change parsed values."""
+    for body in (
+        b'{"a": 1, "b": [true, null, 2.5]}',
+        b'{"a": NaN, "b": Infinity}',
+        b'{"a": 123456789012345678901234567890}',
+        b'{"a": -9223372036854775809}',
+    ):
+        decoded = _json_loads(body)
+        expected = json.loads(body)
+        assert repr(decoded) == repr(expected)
+        assert type(decoded["a"]) is type(expected["a"])
+
+
+def _limited_check(max_body_bytes: int):
+    return _build_check(
+        config={
+            "url": "http://h",
+            "checks": [{"path": "$.a", "op": "<", "value": 1, "severity": "warning"}],
+            "max_body_bytes": max_body_bytes,
+        }
+    )
+
+
+def test_oversized_body_stops_streaming_at_the_limit() -> None:
+    response = StubResponse(200, {"padding": "x" * 256})
+    executor = JsonMetricsExecutor(client=StubClient(response))
+
+    result = anyio.run(executor.execute, _limited_check(32))
+
+    assert result.status == ResultStatus.ERROR
+    assert result.data["error_type"] == "payload_too_large"
+    # Two 16-byte chunks fit, the third crosses the limit and ends the read
+    assert response.chunks_read == 3
+
+
+def test_declared_content_length_over_limit_skips_the_body() -> None:
+    response = StubResponse(200, {"a": 0}, headers={"content-length": "4096"})
+    executor = JsonMetricsExecutor(client=StubClient(response))
+
+    result = anyio.run(executor.execute, _limited_check(1024))
+
+    assert result.data["error_type"] == "payload_too_large"
+    assert response.chunks_read == 0
+
+
 def test_path_missing_counts_as_failure() -> None:
     """Missing path in response counts as threshold failure."""
     client = StubClient(StubResponse(200, {"services": {}}))
@@ -221,6 +282,23 @@ def test_bracket_array_path_is_supported() -> None:
     assert result.status == ResultStatus.OK
 
 
+def test_root_path_compares_whole_payload() -> None:
+    client = StubClient(StubResponse(200, 3))
+    executor = JsonMetricsExecutor(client=client)
+    check = _build_check(
+        config={
+            "url": "http://h",
+            "checks": [
+                {"path": "$", "op": "<", "value": 5, "severity": "critical"},
+            ],
+        }
+    )
+
+    result = anyio.run(executor.execute, check)
+
+    assert result.status == ResultStatus.OK
+
+
 def test_timeout_retries_then_fails(monkeypatch) -> None:
     timeout_exc = httpx.TimeoutException("boom")
     client = StubClient(timeout_exc)
@@ -247,3 +325,31 @@ def test_timeout_retries_then_fails(monkeypatch) -> None:
     assert client.calls == 2
     assert result.status == ResultStatus.ERROR
     assert result.data["error_type"] == "timeout"
+
+
+def test_requests_per_host_are_capped() -> None:
+    class SlowClient(StubClient):
+        def __init__(self, response):
+            super().__init__(response)
+            self.in_flight = 0
+            self.peak = 0
+
+        @asynccontextmanager
+        async def stream(self, method, url, auth=None, timeout=None):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await anyio.sleep(0.01)
+            self.in_flight -= 1
+            yield self.response
+
+    client = SlowClient(StubResponse(200, {"mail": {"queue_total": 1}}))
+    executor = JsonMetricsExecutor(client=client, max_host_concurrency=2)
+
+    async def run_all() -> None:
+        async with anyio.create_task_group() as tg:
+            for check_id in range(5):
+                tg.start_soon(executor.execute, _build_check(check_id=check_id))
+
+    anyio.run(run_all)
+
+    assert client.peak == 2
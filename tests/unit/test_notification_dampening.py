@@ -5,9 +5,9 @@ from __future__ import annotations
 from typing import Any
 
 from nyxmon.adapters.repositories import InMemoryStore
-from nyxmon.domain.commands import AddCheckResult
+from nyxmon.domain.commands import AddCheckResult, AddCheckResults
 from nyxmon.domain.models import Check, CheckResult, CheckType, Result, ResultStatus
-from nyxmon.service_layer.handlers import add_check_result
+from nyxmon.service_layer.handlers import add_check_result, add_check_results
 from nyxmon.service_layer.unit_of_work import UnitOfWork
 
 
@@ -119,3 +119,38 @@ def test_threshold_one_notifies_first_failure(monkeypatch) -> None:
     _add_result(uow, notifier, ResultStatus.ERROR)
 
     assert len(notifier.failed_notifications) == 1
+
+
+def test_batched_results_are_stored_together_and_dampened(monkeypatch) -> None:
+    monkeypatch.delenv("NYXMON_NOTIFY_CONSECUTIVE_FAILURES", raising=False)
+    uow = UnitOfWork(store=InMemoryStore())
+    notifier = StubNotifier()
+    _add_result(uow, notifier, ResultStatus.ERROR)
+
+    check = _build_check()
+    other = Check(
+        check_id=2,
+        service_id=1,
+        check_type=CheckType.HTTP,
+        url="https://other.test/health",
+        data={},
+    )
+    add_check_results(
+        AddCheckResults(
+            check_results=[
+                CheckResult(
+                    check=check,
+                    result=Result(check_id=1, status=ResultStatus.ERROR, data={}),
+                ),
+                CheckResult(
+                    check=other,
+                    result=Result(check_id=2, status=ResultStatus.ERROR, data={}),
+                ),
+            ]
+        ),
+        uow,
+        notifier,
+    )
+
+    assert len(uow.store.results.list()) == 3
+    assert [c.check_id for c, _ in notifier.failed_notifications] == [1]
@@ -0,0 +1,19 @@
+"""Unit tests for the shared retry backoff."""
+
+from nyxmon.adapters.runner.executors.retry import MAX_BACKOFF, backoff_delay
+
+
+def test_backoff_grows_with_jitter_and_is_capped() -> None:
+    second = backoff_delay(2.0, 1)
+
+    assert backoff_delay(2.0, 0) == 2.0
+    assert 4.0 <= second <= 6.0
+    assert backoff_delay(2.0, 10) == MAX_BACKOFF
+
+
+def test_long_configured_delays_are_kept() -> None:
+    assert backoff_delay(300.0, 3) == 300.0
+
+
+def test_zero_delay_stays_zero() -> None:
+    assert backoff_delay(0, 5) == 0.0
@@ -8,7 +8,10 @@ from typing import Any, Awaitable, Callable
 import anyio
 import pytest
 
-from nyxmon.adapters.runner.executors.tcp_executor import TcpCheckExecutor
+from nyxmon.adapters.runner.executors.tcp_executor import (
+    TcpCheckExecutor,
+    _der_not_after,
+)
 from nyxmon.domain import Check, CheckType, ResultStatus
 
 
@@ -289,3 +292,23 @@ async def test_retries_transient_connection_failure() -> None:
 
     assert result.status == ResultStatus.OK
     assert result.data["attempt"] == 2
+
+
+def test_der_not_after_matches_certificate_validity() -> None:
+    der = ssl.PEM_cert_to_DER_cert(TEST_CERT)
+
+    assert _der_not_after(der) == ssl.cert_time_to_seconds("Jan  8 14:07:28 2026 GMT")
+    assert _der_not_after(b"\x30\x82") is None
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        (b"220 2.0.0 Ready to start TLS\r\n", True),
+        (b"454 TLS not available\r\n", False),
+        (b". OK Begin TLS negotiation now\r\n", True),
+        (b"", False),
+    ],
+)
+def test_starttls_response_detection_on_bytes(response: bytes, expected: bool) -> None:
+    assert TcpCheckExecutor()._is_positive_starttls_response(response) is expected